@@ -12,16 +12,18 @@ LOGGER = logging.getLogger(__name__)
 ACTION_INVENTORY: Dict = dict()
 
 
-def registerAction(*args, **kwargs) -> Callable:
+def registerAction(*args,
+                   name: Optional[str] = None,
+                   description: Optional[str] = None,
+                   options: Optional[Arguments] = None) -> Callable:
     """A decorator for registering an action
 
     """
     def _registerAction(cls: Type[object]) -> Type[object]:
-        LOGGER.debug("Registering Action %s"
-                     % (cls.__qualname__))
-        reg: 'ActionRegistrationForm' = ActionRegistrationForm(**kwargs)
-        global ACTION_INVENTORY
-        if reg.name not in ACTION_INVENTORY.keys() and reg.name is not None:
+        LOGGER.debug("Registering Action %s", cls.__qualname__)
+        reg: 'ActionRegistrationForm' = \
+            ActionRegistrationForm._from_decorator(name, description, options)
+        if reg.name is not None and reg.name not in ACTION_INVENTORY:
             ACTION_INVENTORY[reg.name] = type(
                 'actionstub', tuple(), {'registration': reg})
             cls.options = Config._for(reg.name)  # type: ignore
@@ -32,27 +34,50 @@ def registerAction(*args, **kwargs) -> Callable:
 class ActionRegistrationForm:
     """Action metadata helper class
     """
+    __slots__ = ('name', 'description', 'options')
+
     def __init__(self, *args, **kwargs) -> None:
-        self.name: Optional[str] = None
-        self.description: Optional[str] = None
-        self.options: Arguments = Arguments()
-
-        for (key, val) in kwargs.items():
-            if key == 'name':
-                self.name = val
-            elif key == 'description':
-                self.description = val
-            elif key == 'options':
-                if not isinstance(val, Arguments):
-                    raise TypeError("'options must be of type 'Arguments'")
-
-                self.options = val
-            else:
-                raise TypeError('%s is an invalid keyword argument' % (key))
+        self.name: Optional[str] = kwargs.pop('name', None)
+        self.description: Optional[str] = kwargs.pop('description', None)
+        options: Optional[Arguments] = kwargs.pop('options', None)
+
+        if kwargs:
+            raise TypeError('%s is an invalid keyword argument'
+                            % (next(iter(kwargs))))
+
+        if options is None:
+            self.options: Arguments = Arguments()
+        elif not isinstance(options, Arguments):
+            raise TypeError("'options must be of type 'Arguments'")
+        else:
+            self.options = options
 
         if self.name is None:
             raise AttributeError("Action must define name")
 
+    @classmethod
+    def _from_decorator(cls, name: Optional[str],
+                        description: Optional[str] = None,
+                        options: Optional[Arguments] = None
+                        ) -> 'ActionRegistrationForm':
+        """Build a form from registerAction's already separated arguments
+
+            This skips the generic keyword handling of __init__
+        """
+        if name is None:
+            raise AttributeError("Action must define name")
+
+        if options is None:
+            options = Arguments()
+        elif not isinstance(options, Arguments):
+            raise TypeError("'options must be of type 'Arguments'")
+
+        self: 'ActionRegistrationForm' = cls.__new__(cls)
+        self.name = name
+        self.description = description
+        self.options = options
+        return self
+
 
 class _Config_:
     """Real object that stores/tracks config.
@@ -61,23 +86,38 @@ class _Config_:
         imported into other code, but since config might not be available
         that is abstracted
     """
+    __slots__ = ('_config_', '_cache')
+
     def __init__(self, config: Configuration) -> None:
         self._config_ = config
+        self._cache: Dict[str, Dict] = dict()
 
     def _for(self, name: str) -> Dict:
+        cached: Optional[Dict] = self._cache.get(name)
+        if cached is not None:
+            return cached
+
         action_config = self._config_.actionConfig(name)
         out_config = dict()
         if name not in ACTION_INVENTORY:
             LOGGER.warning("Config for unregistered action requested")
-            out_config = action_config.options
+            # A copy, the options belong to the (shared) entity config
+            out_config = dict(action_config.options)
             out_config['common'] = action_config.common
         else:
             parser = ACTION_INVENTORY[name].registration.options
             out_config = parser.parse(
                 action_config.options, action_config.common)
+            # Only parsed configs of registered actions are cached, an
+            # unregistered action may still register later on
+            self._cache[name] = out_config
 
         return out_config
 
+    def invalidate(self, name: str) -> None:
+        """Drop the cached config for the given action, if any"""
+        self._cache.pop(name, None)
+
 
 class Config:
     """Convenience object to access action config
@@ -108,12 +148,20 @@ def setupActionLoader(extra_actions: List[str], config: Configuration) -> None:
         config section for something
     """
 
-    global Config
     Config._config_obj_ = _Config_(config)
 
+    # Parse the configs of already registered actions up front so later
+    # lookups are served from the cache
+    for name in ACTION_INVENTORY:
+        try:
+            Config._config_obj_._for(name)
+        except ValueError:
+            LOGGER.exception("Unable to parse config for action %s", name)
+
     # Get the absolute paths in case relative paths were passed in
     try:
-        abspaths = [os.path.abspath(path) for path in extra_actions]
+        abspaths = [path if os.path.isabs(path) else os.path.abspath(path)
+                    for path in extra_actions]
     except Exception:
         print("Unable to resolve action paths")
         exit(1)
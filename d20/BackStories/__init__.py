@@ -1,24 +1,35 @@
+from __future__ import annotations
+
 import os
-from typing import TYPE_CHECKING, List, Dict, Set, Type, Optional
+from typing import (TYPE_CHECKING, List, Dict, FrozenSet, Set, Tuple, Type,
+                    Optional)
 
 from d20.Manual.Logger import logging, Logger
-from d20.Manual.Registration import BackStoryRegistrationForm
 from d20.Manual.Utils import loadExtras
-from d20.Manual.Facts import Fact, getFactClass
-from d20.Manual.Config import Configuration, EntityConfiguration
 from d20.version import GAME_ENGINE_VERSION
 
 
 if TYPE_CHECKING:
+    from d20.Manual.Config import Configuration, EntityConfiguration
+    from d20.Manual.Facts import Fact
+    from d20.Manual.Registration import BackStoryRegistrationForm
     from d20.Manual.Templates import BackStoryTemplate
 
 
+# Directory of this file, where built-in backstories reside
+_MODULE_DIR: str = os.path.dirname(os.path.abspath(__file__))
 LOADED: Set = set()
+# Plugin directory -> (mtime (ns), entry names) at the time it was last loaded
+LOADED_PATHS: Dict[str, Tuple[int, FrozenSet[str]]] = dict()
 STORIES: Dict[str, 'BackStory'] = dict()
+STORIES_BY_NAME: Dict[str, str] = dict()
+_STORIES_LIST: List['BackStory'] = list()
 LOGGER: Logger = logging.getLogger(__name__)
 
 
 class BackStory:
+    __slots__ = ('name', 'cls', 'registration', 'config')
+
     def __init__(self, name: str, cls: Type['BackStoryTemplate'],
                  registration: BackStoryRegistrationForm) -> None:
         self.name: str = name
@@ -34,6 +45,8 @@ def resolveBackStoryFacts(backstory_facts: Dict) -> List[Fact]:
         backstory_facts {list(dict)]} -- A list of dicts that represent
             d20 facts
     """
+    from d20.Manual.Facts import getFactClass
+
     try:
         backstory_facts['facts']
     except KeyError:
@@ -41,13 +54,21 @@ def resolveBackStoryFacts(backstory_facts: Dict) -> List[Fact]:
         return []
 
     facts: List[Fact] = list()
+    # Backstory facts tend to repeat a handful of classes
+    fact_classes: Dict[str, Type[Fact]] = dict()
     for fact_template in backstory_facts['facts']:
+        fact_name: str = fact_template['name']
         try:
-            fact_class: Type[Fact] = getFactClass(fact_template['name'])
-            LOGGER.debug(fact_class)
-        except Exception:
-            LOGGER.exception("Unknown fact class %s" % (fact_template['name']))
-            continue
+            fact_class: Type[Fact] = fact_classes[fact_name]
+        except KeyError:
+            try:
+                fact_class = getFactClass(fact_name)
+                if logging.ENABLE_DEBUG:
+                    LOGGER.debug(fact_class)
+            except Exception:
+                LOGGER.exception("Unknown fact class %s", fact_name)
+                continue
+            fact_classes[fact_name] = fact_class
 
         arguments = fact_template['arguments']
         fact: Fact = fact_class(**arguments)
@@ -82,46 +103,61 @@ def verifyBackStories(extra_backstories: List[str],
         raise
 
     # Iterate through BackStories and inject configuration
-    for (backstory_class_name, backstory) in STORIES.items():
+    for backstory in _STORIES_LIST:
         backstory.config = config.backStoryConfig(backstory.name)
 
-    return list(STORIES.values())
+    # Callers may prune the list, so hand out a copy
+    return _STORIES_LIST.copy()
 
 
 def loadBackStory(backstory_class: Type['BackStoryTemplate'],
                   **kwargs: str) -> None:
-    reg: BackStoryRegistrationForm = BackStoryRegistrationForm(**kwargs)
-    ev: str = GAME_ENGINE_VERSION
-    if reg.engine_version is not None and reg.engine_version > ev:
-        raise ValueError("BackStory %s expects version %s or newer"
-                         % (reg.name, reg.engine_version))
+    from d20.Manual.Registration import BackStoryRegistrationForm
 
+    reg: BackStoryRegistrationForm = BackStoryRegistrationForm(**kwargs)
     if reg.name is None:
         raise ValueError("NPC does not have a name")
 
-    global STORIES
+    # Both sides are already parsed version objects, GAME_ENGINE_VERSION
+    # is parsed once at import time
+    if reg.engine_version is not None and \
+            reg.engine_version > GAME_ENGINE_VERSION:
+        raise ValueError("BackStory %s expects version %s or newer"
+                         % (reg.name, reg.engine_version))
+
     clsname: str = backstory_class.__qualname__
     if clsname in STORIES:
-        LOGGER.warning("BackStory with class name %s already registered"
-                       % (clsname))
+        LOGGER.warning("BackStory with class name %s already registered",
+                       clsname)
         return
 
-    for (name, ncls) in STORIES.items():
-        if reg.name == ncls.registration.name:
-            LOGGER.warning("BackStory with name %s already registered"
-                           % (reg.name))
-            return
+    if reg.name in STORIES_BY_NAME:
+        LOGGER.warning("BackStory with name %s already registered",
+                       reg.name)
+        return
 
     # If no errors, add backstory to list
-    STORIES[clsname] = BackStory(reg.name, backstory_class, reg)
+    backstory: BackStory = BackStory(reg.name, backstory_class, reg)
+    STORIES[clsname] = backstory
+    STORIES_BY_NAME[reg.name] = clsname
+    _STORIES_LIST.append(backstory)
 
 
 def loadBackStories(extra_backstories: List[str]) -> None:
-    # Get this files directory
-    paths: List[str] = [os.path.dirname(os.path.abspath(__file__))]
-    paths.extend(extra_backstories)
+    paths: List[str] = [_MODULE_DIR, *extra_backstories]
+
+    for path in paths:
+        # A directory's mtime only changes when entries are added or
+        # removed, so unchanged directories have nothing new to load. The
+        # names are compared too, on filesystems with coarse timestamps an
+        # entry added within the same tick leaves the mtime as it was
+        state: Tuple[int, FrozenSet[str]] = (
+            os.stat(path).st_mtime_ns, frozenset(os.listdir(path)))
+        if LOADED_PATHS.get(path) == state:
+            continue
 
-    loadExtras(paths, LOADED)
+        loadExtras([path], LOADED)
+        LOADED_PATHS[path] = state
 
 
 __all__ = ["loadBackStories",
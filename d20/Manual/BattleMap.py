@@ -1,19 +1,22 @@
 import copy
-import base64
+import binascii
 import hashlib
 import time
 import threading
 import os
 import pathlib
-import re
+import string
 import sys
 from io import BytesIO
-from typing import (Dict, ItemsView, Iterator, List,
-                    Match, Optional, Set, Type,
+from types import MappingProxyType
+from typing import (Callable, Dict, ItemsView, Iterator, List,
+                    Mapping, Optional, Set, Tuple, Type,
                     TypeVar, Union, ValuesView)
 
 from d20.Manual.Exceptions import (DuplicateObjectError, NotFoundError)
 from d20.Manual.Facts import (Fact, loadFact, RegisteredFacts)
+from d20.Manual.Utils import (attrSetter, idList, idSetOrEmpty,
+                              idSetSetter)
 from d20.Manual.Temporary import (
     TemporaryObjectOnDisk,
     TemporaryObjectStream
@@ -22,6 +25,33 @@ from d20.Manual.Temporary import (
 
 FactType = TypeVar('FactType', bound='FactTable')
 
+
+def _sha256(data: Union[bytes, bytearray, memoryview]) -> bytes:
+    """Returns the raw sha256 digest of the given data
+
+        hashlib's sha256 is backed by OpenSSL, which already dispatches to
+        the CPU's SHA extensions (SHA-NI, ARMv8) when available and drops
+        the GIL while hashing larger buffers. All object hashing goes
+        through here so the backend can be swapped in one place
+    """
+    return hashlib.sha256(data).digest()
+
+
+# TODO FIXME this approach is naive, need better detection of
+# Windows paths
+def _isWindowsPath(filename: str) -> bool:
+    """Returns whether filename starts with a drive letter, e.g., 'C:\\'"""
+    return (len(filename) >= 3
+            and filename[1] == ':'
+            and filename[2] == '\\'
+            and filename[0] in string.ascii_letters)
+
+
+# Metadata value types which can be handed out without copying
+_IMMUTABLE_METADATA: Tuple[Type, ...] = (
+    str, bytes, int, float, bool, type(None))
+
+
 # Fact and Hypothesis 'table' is organized using a python dict
 # The dict pairs up a fact type from the RegisteredFacts
 # list to a 'TableColumn'
@@ -34,6 +64,7 @@ class TableColumn(object):
 
         This class uses a list to store the rows of a given column
     """
+    __slots__ = ('_table_type', 'column')
 
     def __init__(self, type: str, **kwargs) -> None:
         self._table_type: str = type
@@ -44,6 +75,13 @@ class TableColumn(object):
             raise ValueError("Cannot add fact to column of different type")
         self.column.append(fact)
 
+    def extend(self, facts: List[Fact]) -> None:
+        for fact in facts:
+            if fact._type != self._table_type:
+                raise ValueError(
+                    "Cannot add fact to column of different type")
+        self.column.extend(facts)
+
     def remove(self, fact: Fact) -> None:
         self.column.remove(fact)
 
@@ -57,7 +95,7 @@ class TableColumn(object):
         return self.column.__getitem__(*args, **kwargs)
 
     def tolist(self) -> List[Fact]:
-        return copy.copy(self.column)
+        return self.column[:]
 
     def save(self) -> Dict:
         data = {
@@ -73,6 +111,7 @@ class FactTable(object):
         This class is the master fact table of all facts for a given run
         and consists of multiple TableColumns, each column of a given fact type
     """
+    __slots__ = ('_ids', '_columns', '_byId')
     _tainted_: bool = False
 
     def __init__(self, *args, **kwargs) -> None:
@@ -95,10 +134,7 @@ class FactTable(object):
 
     def findById(self, id: int) -> Optional[Fact]:
         """Return an item instance by a given id"""
-        if id in self._byId.keys():
-            return self._byId[id]
-        else:
-            return None
+        return self._byId.get(id)
 
     def add(self, item: Fact, id: Optional[int] = None) -> int:
         """Add an item to the table
@@ -113,43 +149,50 @@ class FactTable(object):
         if item._type is None:
             raise TypeError(("Item was not created correctly - missing type"))
 
-        self.addColumn(item._type)
+        # A column only exists once its type was checked against
+        # RegisteredFacts, so the check is only needed on a miss
+        column: Optional[TableColumn] = self._columns.get(item._type)
+        if column is None:
+            column = self._addColumn(item._type)
         if id is None:
             id = self._ids
             self._ids += 1
         item._setID(id)
-        self._columns[item._type].append(item)
+        column.append(item)
         self._byId[id] = item
 
         return id
 
+    def _addColumn(self, _type: str) -> TableColumn:
+        """Creates and returns a TableColumn for a type not yet present"""
+        if _type not in RegisteredFacts:
+            raise ValueError("Unrecognized type")
+
+        column: TableColumn = TableColumn(_type)
+        self._columns[_type] = column
+        return column
+
     def addColumn(self, _type: str) -> None:
         """Adds a TableColumn of the given type if not present"""
         if _type not in RegisteredFacts:
             raise ValueError("Unrecognized type")
 
-        if _type not in self._columns.keys():
-            self._columns[_type] = TableColumn(_type)
+        if _type not in self._columns:
+            self._addColumn(_type)
 
     def getColumn(self, _type: str) -> Optional[TableColumn]:
         """Returns a TableColumn of the given type"""
         if _type not in RegisteredFacts:
             raise ValueError("Unrecognized type")
 
-        if _type not in self._columns.keys():
-            return None
-        else:
-            return self._columns[_type]
+        return self._columns.get(_type)
 
     def hasColumn(self, _type: str) -> bool:
         """Returns a boolean whether a TableColumn for the given type exists"""
         if _type not in RegisteredFacts:
             raise ValueError("Unrecognized type")
 
-        if _type in self._columns.keys():
-            return True
-
-        return False
+        return _type in self._columns
 
     def save(self) -> Dict:
         data = {
@@ -161,18 +204,36 @@ class FactTable(object):
         }
         return data
 
+    def _bulkAdd(self, _type: str, items: List[Fact]) -> None:
+        """Add items of one type which already carry their ids
+
+            Used on load, so the column is resolved once per type instead
+            of once per item
+        """
+        for item in items:
+            if item.tainted != self.tainted:
+                raise TypeError(("Attempt to add tainted/untainted item to "
+                                 "wrong table"))
+            if item.id is None:
+                raise TypeError("Item was not saved with an id")
+
+        column: Optional[TableColumn] = self._columns.get(_type)
+        if column is None:
+            column = self._addColumn(_type)
+        column.extend(items)
+        self._byId.update((item.id, item) for item in items)
+
     @classmethod
     def load(cls: Type[FactType], data: Dict) -> FactType:
         ft = cls()
         ft._ids = data['ids']
         for (_type, column) in data['columns'].items():
-            for item in column['column']:
-                loaded_item = loadFact(item)
-                ft.add(loaded_item, loaded_item.id)
+            ft._bulkAdd(_type, [loadFact(item) for item in column['column']])
         return ft
 
 
 class HypothesisTable(FactTable):
+    __slots__ = ()
     _tainted_: bool = True
 
     def __init__(self, *args, **kwargs) -> None:
@@ -187,6 +248,43 @@ class HypothesisTable(FactTable):
         return item
 
 
+def _setMetadataRaw(obj: 'FileObject', value: Optional[Dict],
+                    trusted: bool) -> None:
+    if value is not None:
+        obj._metadata = value
+
+
+def _setMetadata(obj: 'FileObject', value: Optional[Dict],
+                 trusted: bool) -> None:
+    if value is not None:
+        for (mname, mvalue) in value.items():
+            obj.add_metadata(mname, mvalue)
+
+
+def _setEncoding(obj: 'FileObject', value: Optional[str],
+                 trusted: bool) -> None:
+    if value is not None:
+        obj._encoding = value
+
+
+# FileObject keyword argument name -> setter(obj, value, trusted)
+# Unknown keyword arguments are ignored
+_FILEOBJECT_KWARGS: Mapping[str, Callable] = MappingProxyType({
+    '_metadata_': _setMetadataRaw,
+    'metadata': _setMetadata,
+    '_creator_': attrSetter('_creator_'),
+    '_created_': attrSetter('_created_'),
+    'encoding': _setEncoding,
+    '_parentObjects_': idSetSetter('_parentObjects_', "parent objects"),
+    '_parentFacts_': idSetSetter('_parentFacts_', "parent facts"),
+    '_parentHyps_': idSetSetter('_parentHyps_', "parent hypotheses"),
+    '_childObjects_': idSetSetter('_childObjects_', "child objects"),
+    '_childFacts_': idSetSetter('_childFacts_', "child facts"),
+    '_childHyps_': idSetSetter('_childHyps_', "child hypotheses"),
+    '_digest_': attrSetter('_digest'),
+})
+
+
 class FileObject(object):
     """Class representing an 'object'
 
@@ -204,121 +302,60 @@ class FileObject(object):
             _childObjects_: A list of id's of 'child' objects
             _childFacts_: A list of id's of 'child' facts
             _childHyps_: A list of id's of 'child' hyp's
+            _digest_: The precomputed raw sha256 of data, if already known
     """
-
-    # TODO FIXME this approach is naive, need better detection of
-    # Windows paths
-    isWindowsRegex = re.compile(r'^[a-zA-Z]:\\')
+    __slots__ = ('_id', '_data', '_metadata', '_creator_', '_created_',
+                 '_ondisk_', '_stream_', '_encoding',
+                 '_parentObjects_', '_parentFacts_', '_parentHyps_',
+                 '_childObjects_', '_childFacts_', '_childHyps_',
+                 '_hash', '_digest')
 
     def __init__(self, data: Union[bytes, bytearray, str], id: int, **kwargs):
         self._id: int = id
-        self._data: Union[bytes, bytearray, str] = data
-        self._size: Optional[int] = None
         self._metadata: Dict = dict()
         self._creator_: Optional[str] = None
-        self._created_: float = time.time()
+        # Loaded objects carry their own timestamp, don't read the clock
+        if '_created_' not in kwargs:
+            self._created_: float = time.time()
         self._ondisk_: Optional[TemporaryObjectOnDisk] = None
         self._stream_: Optional[TemporaryObjectStream] = None
         self._encoding: str = 'utf-8'
-        self._parentObjects_: Set[int] = set()
-        self._parentFacts_: Set[int] = set()
-        self._parentHyps_: Set[int] = set()
-        self._childObjects_: Set[int] = set()
-        self._childFacts_: Set[int] = set()
-        self._childHyps_: Set[int] = set()
+        # Edge sets are only allocated once an edge is added, most objects
+        # never get some (or any) of them
+        self._parentObjects_: Optional[Set[int]] = None
+        self._parentFacts_: Optional[Set[int]] = None
+        self._parentHyps_: Optional[Set[int]] = None
+        self._childObjects_: Optional[Set[int]] = None
+        self._childFacts_: Optional[Set[int]] = None
+        self._childHyps_: Optional[Set[int]] = None
+        self._hash: Optional[str] = None
+        self._digest: Optional[bytes] = None
+        # Id sets coming from a save state were already validated
+        trusted: bool = kwargs.pop('_trusted_', False)
 
         for (name, value) in kwargs.items():
-            if name == '_metadata_':
-                if value is not None:
-                    self._metadata = value
-            elif name == 'metadata':
-                if value is not None:
-                    for (mname, mvalue) in value.items():
-                        self.add_metadata(mname, mvalue)
-            elif name == '_creator_':
-                self._creator_ = value
-            elif name == '_created_':
-                self._created_ = value
-            elif name == 'encoding':
-                if value is not None:
-                    self._encoding = value
-            elif name == '_parentObjects_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int) for i in list(value)):
-                            raise TypeError(("parent objects must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._parentObjects_ = set(value)
-            elif name == '_parentFacts_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int) for i in list(value)):
-                            raise TypeError(("parent facts must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._parentFacts_ = set(value)
-            elif name == '_parentHyps_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int) for i in list(value)):
-                            raise TypeError(("parent hypotheses must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._parentHyps_ = set(value)
-            elif name == '_childObjects_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int) for i in list(value)):
-                            raise TypeError(("child objects must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._childObjects_ = set(value)
-            elif name == '_childFacts_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int) for i in list(value)):
-                            raise TypeError(("child facts must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._childFacts_ = set(value)
-            elif name == '_childHyps_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int) for i in list(value)):
-                            raise TypeError(("child hypotheses must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._childHyps_ = set(value)
-            else:
-                pass  # TODO XXX
+            setter: Optional[Callable] = _FILEOBJECT_KWARGS.get(name)
+            if setter is not None:
+                setter(self, value, trusted)
 
-        if not isinstance(self._data, bytes):
-            if isinstance(self._data, bytearray):
+        if not isinstance(data, bytes):
+            if isinstance(data, bytearray):
                 try:
-                    self._data = bytes(self._data)
+                    data = bytes(data)
                 except Exception:
                     raise TypeError(
                         "Unable to convert provided 'bytearray' into 'bytes'"
                     )
-            elif isinstance(self._data, str):
+            elif isinstance(data, str):
                 try:
-                    self._data = bytes(self._data, self._encoding)
+                    data = bytes(data, self._encoding)
                 except Exception:
                     raise TypeError("Unable to convert provided data into"
                                     " 'bytes' using %s encoding" %
                                     (self._encoding))
             else:
                 raise TypeError("Expected a bytes or str type")
-
-        self._hash = hashlib.sha256(self._data).hexdigest()
-        self._size = len(self._data)
+        self._data: bytes = data
 
     @property
     def id(self) -> int:
@@ -326,68 +363,109 @@ class FileObject(object):
 
     @property
     def parentObjects(self) -> List[int]:
-        return list(self._parentObjects_)
+        return idList(self._parentObjects_)
 
     def addParentObject(self, parent: int) -> None:
+        if self._parentObjects_ is None:
+            self._parentObjects_ = set()
         self._parentObjects_.add(parent)
 
     def remParentObject(self, parent: int) -> None:
-        self._parentObjects_.discard(parent)
+        if self._parentObjects_ is not None:
+            self._parentObjects_.discard(parent)
+
+    def hasParentObject(self, parent: int) -> bool:
+        return (self._parentObjects_ is not None
+                and parent in self._parentObjects_)
 
     @property
     def parentFacts(self) -> List[int]:
-        return list(self._parentFacts_)
+        return idList(self._parentFacts_)
 
     def addParentFact(self, parent: int) -> None:
+        if self._parentFacts_ is None:
+            self._parentFacts_ = set()
         self._parentFacts_.add(parent)
 
     def remParentFact(self, parent: int) -> None:
-        self._parentFacts_.discard(parent)
+        if self._parentFacts_ is not None:
+            self._parentFacts_.discard(parent)
+
+    def hasParentFact(self, parent: int) -> bool:
+        return (self._parentFacts_ is not None
+                and parent in self._parentFacts_)
 
     @property
     def parentHyps(self) -> List[int]:
-        return list(self._parentHyps_)
+        return idList(self._parentHyps_)
 
     def addParentHyp(self, parent: int) -> None:
+        if self._parentHyps_ is None:
+            self._parentHyps_ = set()
         self._parentHyps_.add(parent)
 
     def remParentHyp(self, parent: int) -> None:
-        self._parentHyps_.discard(parent)
+        if self._parentHyps_ is not None:
+            self._parentHyps_.discard(parent)
+
+    def hasParentHyp(self, parent: int) -> bool:
+        return (self._parentHyps_ is not None
+                and parent in self._parentHyps_)
 
     @property
     def childObjects(self) -> List[int]:
-        return list(self._childObjects_)
+        return idList(self._childObjects_)
 
     def addChildObject(self, child: int) -> None:
+        if self._childObjects_ is None:
+            self._childObjects_ = set()
         self._childObjects_.add(child)
 
     def remChildObject(self, child: int) -> None:
-        self._childObjects_.discard(child)
+        if self._childObjects_ is not None:
+            self._childObjects_.discard(child)
+
+    def hasChildObject(self, child: int) -> bool:
+        return (self._childObjects_ is not None
+                and child in self._childObjects_)
 
     @property
     def childFacts(self) -> List[int]:
-        return list(self._childFacts_)
+        return idList(self._childFacts_)
 
     def addChildFact(self, child: int) -> None:
+        if self._childFacts_ is None:
+            self._childFacts_ = set()
         self._childFacts_.add(child)
 
     def remChildFact(self, child: int) -> None:
-        self._childFacts_.discard(child)
+        if self._childFacts_ is not None:
+            self._childFacts_.discard(child)
+
+    def hasChildFact(self, child: int) -> bool:
+        return (self._childFacts_ is not None
+                and child in self._childFacts_)
 
     @property
     def childHyps(self) -> List[int]:
-        return list(self._childHyps_)
+        return idList(self._childHyps_)
 
     def addChildHyp(self, child: int) -> None:
+        if self._childHyps_ is None:
+            self._childHyps_ = set()
         self._childHyps_.add(child)
 
     def remChildHyp(self, child: int) -> None:
-        self._childHyps_.discard(child)
+        if self._childHyps_ is not None:
+            self._childHyps_.discard(child)
+
+    def hasChildHyp(self, child: int) -> bool:
+        return (self._childHyps_ is not None
+                and child in self._childHyps_)
 
     def __addMetadataFilename(self, filename: str):
-        isWindows: Optional[Match[str]] = self.isWindowsRegex.match(filename)
         try:
-            if isWindows:
+            if _isWindowsPath(filename):
                 path: Union[pathlib.PureWindowsPath, pathlib.PurePosixPath] = \
                     pathlib.PureWindowsPath(filename)
             else:
@@ -401,7 +479,13 @@ class FileObject(object):
     @property
     def metadata(self) -> Dict:
         """Returns a copy of the objects metadata"""
-        return copy.deepcopy(self._metadata)
+        # Metadata is almost always flat str -> str, so only values that
+        # could be mutated through the copy need a deep copy
+        metadata: Dict = self._metadata.copy()
+        for (key, value) in metadata.items():
+            if not isinstance(value, _IMMUTABLE_METADATA):
+                metadata[key] = copy.deepcopy(value)
+        return metadata
 
     def add_metadata(self, key: str, value: str) -> None:
         """Setter function to add metadata to object"""
@@ -412,15 +496,28 @@ class FileObject(object):
 
     @property
     def hash(self) -> str:
+        """The hex sha256 of the object's data"""
+        if self._hash is None:
+            self._hash = self.digest.hex()
         return self._hash
 
+    @property
+    def digest(self) -> bytes:
+        """The raw sha256 of the object's data"""
+        # Hashed on first use, objects that are never looked up or
+        # tracked by an ObjectList don't pay for it
+        if self._digest is None:
+            self._digest = _sha256(self._data)
+        return self._digest
+
     @property
     def size(self) -> int:
-        return self._size  # type: ignore
+        # len() of bytes is constant time, no need to store it
+        return len(self._data)
 
     @property
     def data(self) -> bytes:
-        return self._data  # type: ignore
+        return self._data
 
     @property
     def onDisk(self) -> str:
@@ -445,12 +542,12 @@ class FileObject(object):
     @property
     def _internalInfo(self) -> Dict:
         data = {
-            "_parentObjects_": self._parentObjects_,
-            "_parentFacts_": self._parentFacts_,
-            "_parentHyps_": self._parentHyps_,
-            "_childObjects_": self._childObjects_,
-            "_childFacts_": self._childFacts_,
-            "_childHyps_": self._childHyps_,
+            "_parentObjects_": idSetOrEmpty(self._parentObjects_),
+            "_parentFacts_": idSetOrEmpty(self._parentFacts_),
+            "_parentHyps_": idSetOrEmpty(self._parentHyps_),
+            "_childObjects_": idSetOrEmpty(self._childObjects_),
+            "_childFacts_": idSetOrEmpty(self._childFacts_),
+            "_childHyps_": idSetOrEmpty(self._childHyps_),
             "encoding": self._encoding
         }
         return data
@@ -462,23 +559,42 @@ class FileObject(object):
             data = {
                 'id': self._id,
                 'metadata': self._metadata,
-                'hash': self._hash,
-                'size': self._size,
-                'data': base64.b64encode(self._data).decode("utf-8")
+                'hash': self.hash,
+                'size': self.size,
+                'data': self._encodedData()
             }
 
         return data
 
+    def _encodedData(self) -> str:
+        """Return the object's data base64 encoded for serialization"""
+        return binascii.b2a_base64(
+            memoryview(self._data), newline=False).decode("ascii")
+
     def save(self) -> Dict:
-        data = self._creationInfo
-        data.update(self._coreInfo)
-        data.update(self._internalInfo)
-        return data
+        # Same layout as _creationInfo, _coreInfo and _internalInfo
+        # combined, built directly instead of merging the three
+        return {
+            '_creator_': self._creator_,
+            '_created_': self._created_,
+            'id': self._id,
+            'metadata': self._metadata,
+            'hash': self.hash,
+            'size': self.size,
+            'data': self._encodedData(),
+            "_parentObjects_": idSetOrEmpty(self._parentObjects_),
+            "_parentFacts_": idSetOrEmpty(self._parentFacts_),
+            "_parentHyps_": idSetOrEmpty(self._parentHyps_),
+            "_childObjects_": idSetOrEmpty(self._childObjects_),
+            "_childFacts_": idSetOrEmpty(self._childFacts_),
+            "_childHyps_": idSetOrEmpty(self._childHyps_),
+            "encoding": self._encoding
+        }
 
     @staticmethod
     def load(data) -> 'FileObject':
-        data['data'] = base64.b64decode(data['data'])
-        return FileObject(**data)
+        data['data'] = binascii.a2b_base64(data['data'])
+        return FileObject(**data, _trusted_=True)
 
 
 class ObjectList(object):
@@ -489,50 +605,94 @@ class ObjectList(object):
         Args:
             temporary: The temporary path for objects on disk
     """
+    __slots__ = ('objects', '__tmpbase_', '__hashes_', 'object_lock')
 
     def __init__(self, *args, **kwargs):
         self.objects: List[FileObject] = list()
         self.__tmpbase_: Optional[str] = None
-        self.__hashes_: Dict = dict()
+        self.__hashes_: Dict[bytes, int] = dict()
         self.object_lock: threading.Lock = threading.Lock()
 
         for (name, value) in kwargs.items():
             if name == 'temporary':
                 self.__tmpbase_ = os.path.join(value, 'objects')
 
-        if (self.__tmpbase_ is not None
-                and not os.path.exists(self.__tmpbase_)):
-            os.path.mkdirs(self.__tmpbase_)
+        if self.__tmpbase_ is not None:
+            os.makedirs(self.__tmpbase_, exist_ok=True)
 
     def getObjectByData(self, data: bytes) -> Optional[FileObject]:
-        hsh: str = hashlib.sha256(data).hexdigest()
-        return self.getObjectByHash(hsh)
+        return self._getObjectByDigest(_sha256(data))
 
     def getObjectByHash(self, hsh: str) -> Optional[FileObject]:
         try:
-            return self.__getitem__(self.__hashes_[hsh])
-        except Exception:
+            digest: bytes = bytes.fromhex(hsh)
+        except (TypeError, ValueError):
+            return None
+        return self._getObjectByDigest(digest)
+
+    def _getObjectByDigest(self, digest: bytes) -> Optional[FileObject]:
+        # A miss is the common case when adding new objects, so avoid
+        # raising and catching KeyError for it
+        id: Optional[int] = self.__hashes_.get(digest)
+        if id is None:
             return None
+        return self.objects[id]
 
     def addObject(self,
                   data: Union[bytes, bytearray, str],
                   **kwargs
                   ) -> FileObject:
+        # Build and hash the object outside of the lock, only the id
+        # assignment and bookkeeping need to be serialized
+        obj: FileObject = FileObject(data, -1, **kwargs)
+        digest: bytes = obj.digest
         with self.object_lock:
-            id: int = len(self.objects)
-            obj: FileObject = FileObject(data, id, **kwargs)
-            self.append(obj)
+            obj._id = len(self.objects)
+            self._append(obj, digest)
 
         return obj
 
+    def getOrAddObject(self,
+                       data: Union[bytes, bytearray, str],
+                       **kwargs
+                       ) -> Tuple[FileObject, bool]:
+        """Returns the object for the given data, adding it if not tracked
+
+            The data is only hashed once, whether or not it is already
+            tracked. Returns a tuple of the object and whether it was added
+        """
+        # Copy a bytearray up front, so the digest is taken from the same
+        # bytes the object keeps (FileObject won't copy them again)
+        if isinstance(data, bytearray):
+            data = bytes(data)
+        if isinstance(data, bytes):
+            kwargs['_digest_'] = _sha256(data)
+
+        # The object is built even if the data is already tracked, so
+        # invalid arguments raise the same way for duplicates
+        obj: FileObject = FileObject(data, -1, **kwargs)
+        digest: bytes = obj.digest
+        with self.object_lock:
+            existing: Optional[FileObject] = self._getObjectByDigest(digest)
+            if existing is not None:
+                return (existing, False)
+            obj._id = len(self.objects)
+            self._append(obj, digest)
+
+        return (obj, True)
+
     def append(self, file_object: FileObject) -> None:
         if not isinstance(file_object, FileObject):
             raise TypeError("Expected 'FileObject' type")
 
-        if file_object.hash in self.__hashes_.keys():
+        self._append(file_object, file_object.digest)
+
+    def _append(self, file_object: FileObject, digest: bytes) -> None:
+        # Keyed on the raw digest, half the size of the hex string
+        if digest in self.__hashes_:
             raise DuplicateObjectError("Object already exists in list")
 
-        self.__hashes_[file_object.hash] = file_object.id
+        self.__hashes_[digest] = file_object.id
         self.objects.append(file_object)
 
     def __getitem__(self, key: int) -> FileObject:
@@ -545,4 +705,4 @@ class ObjectList(object):
         return self.objects.__len__()
 
     def tolist(self) -> List[FileObject]:
-        return copy.copy(self.objects)
+        return self.objects[:]
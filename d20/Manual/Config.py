@@ -1,15 +1,23 @@
 import argparse
-import cerberus
 import yaml
-from typing import Dict
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Tuple
 
 from d20.Manual.Logger import logging, Logger
 
+# Use libyaml's parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
 
 LOGGER: Logger = logging.getLogger(__name__)
 
 
-d20_schema = {
+# The schemas are constants, read-only views guard against accidental
+# changes, see _D20_RENAMES and friends which are derived from d20_schema
+d20_schema: Mapping[str, Dict] = MappingProxyType({
     'extra-players': {'rename': 'extra_players'},
     'extra_players': {
         'type': ['string', 'list'],
@@ -53,9 +61,9 @@ d20_schema = {
     'maxTurnTime': {
         'type': 'integer'
     }
-}
+})
 
-common_schema = {
+common_schema: Mapping[str, Dict] = MappingProxyType({
     'http_proxy': {
         'type': 'string'
     },
@@ -63,8 +71,94 @@ common_schema = {
         'type': 'string'
     }
 
+})
+
+# Sections whose elements are entity configs
+_ENTITY_SECTIONS: FrozenSet[str] = frozenset(
+    ['Players', 'NPCS', 'Screens', 'Actions', 'BackStories'])
+
+# All known top level sections
+_SECTIONS: Tuple[str, ...] = (
+    'Players', 'NPCS', 'Screens', 'Actions', 'BackStories', 'd20', 'common')
+
+# d20_schema only uses renames and (list of) string/integer types, so
+# instead of going through cerberus' generic rule engine it is unrolled
+# into lookup tables once, see _validateD20. As with cerberus, any
+# (non-string) sequence is a list, tuples included
+_SCHEMA_TYPES: Dict[str, Tuple[type, ...]] = {
+    'string': (str,),
+    'integer': (int,),
+    'list': (list, tuple),
 }
 
+
+def _schemaTypes(rules: Dict) -> Tuple[Tuple[type, ...], Any]:
+    names = rules['type']
+    if isinstance(names, str):
+        return (_SCHEMA_TYPES[names], names)
+    return (tuple(t for name in names for t in _SCHEMA_TYPES[name]), names)
+
+
+_D20_RENAMES: Dict[str, str] = {
+    key: rules['rename']
+    for (key, rules) in d20_schema.items() if 'rename' in rules}
+_D20_TYPES: Dict[str, Tuple[Tuple[type, ...], Any]] = {
+    key: _schemaTypes(rules)
+    for (key, rules) in d20_schema.items() if 'type' in rules}
+_D20_ITEM_TYPES: Dict[str, Tuple[Tuple[type, ...], Any]] = {
+    key: _schemaTypes(rules['schema'])
+    for (key, rules) in d20_schema.items() if 'schema' in rules}
+# Normalized keys listing extra paths, which are merged into args as lists
+_D20_EXTRA_KEYS: FrozenSet[str] = frozenset(
+    key for key in _D20_TYPES if key.startswith('extra_'))
+
+
+def _validateD20(config: Dict) -> Dict:
+    """Validates the d20 section against d20_schema and returns it
+        normalized, i.e., with its renames applied
+
+        Errors are reported in the same form cerberus would
+    """
+    if not isinstance(config, dict):
+        raise TypeError("Expected a dictionary for d20")
+
+    normalized: Dict = dict()
+    errors: Dict[str, List] = dict()
+
+    # As with cerberus, a renamed key replaces its target
+    for (key, value) in config.items():
+        if key not in _D20_RENAMES:
+            normalized[key] = value
+    for (key, value) in config.items():
+        if key in _D20_RENAMES:
+            normalized[_D20_RENAMES[key]] = value
+
+    for (key, value) in normalized.items():
+        try:
+            (types, names) = _D20_TYPES[key]
+        except KeyError:
+            errors[key] = ['unknown field']
+            continue
+
+        if value is None:
+            errors[key] = ['null value not allowed']
+        elif not isinstance(value, types):
+            errors[key] = ['must be of %s type' % (names)]
+        elif isinstance(value, (list, tuple)) and key in _D20_ITEM_TYPES:
+            (itemTypes, itemNames) = _D20_ITEM_TYPES[key]
+            itemErrors: Dict[int, List[str]] = {
+                i: ['must be of %s type' % (itemNames)]
+                for (i, item) in enumerate(value)
+                if not isinstance(item, itemTypes)}
+            if len(itemErrors) > 0:
+                errors[key] = [itemErrors]
+
+    if len(errors) > 0:
+        raise ValueError("Unable to verify d20 config: %s" % (errors))
+
+    return normalized
+
+
 d20_config_example: str = """
 d20:
 #     Path to extra players
@@ -88,6 +182,8 @@ d20:
 
 
 class EntityConfiguration:
+    __slots__ = ('options', 'common')
+
     def __init__(self, myconfig: Dict, common: Dict) -> None:
         if not isinstance(myconfig, dict):
             raise TypeError("Expected 'myconfig' to be a dict")
@@ -106,29 +202,34 @@ class Configuration:
         instance (assumed to be a Namespace instance) and injects/augments
         certain fields
     """
+    __slots__ = ('_config_', '_sections_', '_entities_')
+
     def __init__(self, configFile: str = None, config: Dict = None,
                  args: argparse.Namespace = None) -> None:
         self._config_: Dict = dict()
+        # Entity configs by section and name, see _entity
+        self._entities_: Dict[Tuple[str, str], EntityConfiguration] = \
+            dict()
 
         if configFile is not None:
+            # The parser reads from the file itself, there's no need to
+            # read the whole file into a string first. Opened in binary
+            # so the parser does the decoding instead of a text wrapper
             try:
-                with open(configFile, 'r') as f:
-                    rawConfig = f.read()
+                with open(configFile, 'rb') as f:
+                    config = yaml.load(f, Loader=_SafeLoader)
             except FileNotFoundError:
                 LOGGER.exception("Unable to find configuration file")
                 raise
+            except yaml.YAMLError:
+                LOGGER.exception(("Unable to parse yaml data from "
+                                 "configuration file"))
+                raise
             except Exception:
                 LOGGER.exception(("Unexpected exception attempting to "
                                  "parse configuration file"))
                 raise
 
-            try:
-                config = yaml.safe_load(rawConfig)
-            except Exception:
-                LOGGER.exception(("Unable to parse yaml data from "
-                                 "configuration file"))
-                raise
-
         if config is not None:
             if not isinstance(config, dict):
                 raise TypeError("config must be dict type")
@@ -136,91 +237,94 @@ class Configuration:
             self._config_ = config
 
             # Inject common config into every element
-            for (section, sconfig) in self._config_.items():
-                if section not in ['Players',
-                                   'NPCS',
-                                   'Screens',
-                                   'Actions',
-                                   'BackStories']:
-                    continue
-
-                for (element, econfig) in sconfig.items():
+            for section in _ENTITY_SECTIONS & self._config_.keys():
+                for (element, econfig) in self._config_[section].items():
                     if (not isinstance(econfig, dict)):
                         raise TypeError("Expected a dictionary for %s"
                                         % (element))
-                    if 'common' in econfig.keys():
+                    if 'common' in econfig:
                         raise ValueError("The 'common' key is reserved")
 
         # Check types of d20 sections and inject into
         # args if applicable
         if 'd20' in self._config_:
-            d20_validator: cerberus.Validator = cerberus.Validator(d20_schema)
-            valid: bool = d20_validator.validate(self._config_['d20'])
-            if not valid:
-                raise ValueError(
-                    "Unable to verify d20 config: %s"
-                    % (d20_validator.errors))
-
-            self._config_['d20'] = d20_validator.normalized(
-                self._config_['d20'])
-
-            for (key, value) in self._config_['d20'].items():
-                if key.startswith('extra_'):
-                    if isinstance(value, str):
-                        value = [value]
-                    if args is not None:
-                        try:
-                            getattr(args, key).extend(value)
-                        except AttributeError:
+            self._config_['d20'] = _validateD20(self._config_['d20'])
+
+            if args is not None:
+                for (key, value) in self._config_['d20'].items():
+                    if key in _D20_EXTRA_KEYS:
+                        if isinstance(value, str):
+                            value = [value]
+                        # Extend paths already given, e.g., on the command
+                        # line, anything else (unset, None) is replaced
+                        existing = getattr(args, key, None)
+                        if isinstance(existing, list):
+                            existing.extend(value)
+                        else:
                             setattr(args, key, value)
-                else:
-                    if args is not None:
+                    else:
                         setattr(args, key, value)
 
+        # Resolve the top level sections once, a missing (or empty, e.g.,
+        # a bare 'common:') section resolves to a single empty dict
+        # instead of a new one on every access
+        self._sections_: Dict[str, Dict] = {
+            name: self._config_.get(name) or dict() for name in _SECTIONS}
+
+    def _entity(self, section: str, name: str) -> EntityConfiguration:
+        """Returns the config of the named element of an entity section
+
+            Each element's config is only built once, later lookups of the
+            same element share it
+        """
+        try:
+            return self._entities_[(section, name)]
+        except KeyError:
+            config: Dict = self._sections_[section].get(name, dict())
+            entity: EntityConfiguration = EntityConfiguration(
+                config, self.common)
+            self._entities_[(section, name)] = entity
+            return entity
+
     @property
     def players(self) -> Dict:
-        return self._config_.get('Players', dict())
+        return self._sections_['Players']
 
     def playerConfig(self, playerName: str) -> EntityConfiguration:
-        config = self.players.get(playerName, dict())
-        return EntityConfiguration(config, self.common)
+        return self._entity('Players', playerName)
 
     @property
     def npcs(self) -> Dict:
-        return self._config_.get('NPCS', dict())
+        return self._sections_['NPCS']
 
     def npcConfig(self, NPCName: str) -> EntityConfiguration:
-        config = self.npcs.get(NPCName, dict())
-        return EntityConfiguration(config, self.common)
+        return self._entity('NPCS', NPCName)
 
     @property
     def backStories(self) -> Dict:
-        return self._config_.get('BackStories', dict())
+        return self._sections_['BackStories']
 
     def backStoryConfig(self, BackStoryName: str) -> EntityConfiguration:
-        config = self.backStories.get(BackStoryName, dict())
-        return EntityConfiguration(config, self.common)
+        return self._entity('BackStories', BackStoryName)
 
     @property
     def screens(self) -> Dict:
-        return self._config_.get('Screens', dict())
+        return self._sections_['Screens']
 
     def screenConfig(self, screenName: str) -> EntityConfiguration:
-        config = self.screens.get(screenName, dict())
-        return EntityConfiguration(config, self.common)
+        return self._entity('Screens', screenName)
 
     @property
     def actions(self) -> Dict:
-        return self._config_.get('Actions', dict())
+        return self._sections_['Actions']
 
     def actionConfig(self, actionName: str) -> EntityConfiguration:
-        config = self.actions.get(actionName, dict())
-        return EntityConfiguration(config, self.common)
+        return self._entity('Actions', actionName)
 
     @property
     def d20(self) -> Dict:
-        return self._config_.get('d20', dict())
+        return self._sections_['d20']
 
     @property
     def common(self) -> Dict:
-        return self._config_.get('common', dict())
+        return self._sections_['common']
@@ -1,12 +1,12 @@
+from __future__ import annotations
+
+import threading
 import time
 from collections.abc import Iterable
 from enum import Enum
 from types import SimpleNamespace
-from typing import List, Dict, Optional, Collection, Union, Tuple, Generator
-
-from requests import Session
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util import Retry
+from typing import (TYPE_CHECKING, Any, List, Dict, Optional, Collection,
+                    Union, Tuple, Generator)
 
 from d20.Manual.BattleMap import FileObject
 from d20.Manual.Logger import logging, Logger
@@ -19,9 +19,56 @@ from d20.Manual.RPC import (RPCClient, RPCResponseStatus,
 from d20.Manual.Temporary import PlayerDirectoryHandler
 import d20.Manual.Trackers as Tracker
 
+# requests is only imported once a console actually uses it, most entities
+# never make web requests
+if TYPE_CHECKING:
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
 
 LOGGER: Logger = logging.getLogger(__name__)
 
+# Connection pool sizing of a console's HTTPAdapter, see _buildAdapter
+_POOL_CONNECTIONS: int = 10
+_POOL_MAXSIZE: int = 10
+
+
+def _buildAdapter(total: int = 5,
+                  status_forcelist: Optional[Collection[int]] = None,
+                  backoff_factor: float = 0.2,
+                  **kwargs: Any) -> HTTPAdapter:
+    """Returns an HTTPAdapter for the given Retry configuration
+
+        A console's session mounts the one adapter for both http and https,
+        adapters are not shared between consoles so closing one console's
+        session leaves the pools of the others alone. Unless given,
+        allowed_methods is left to Retry's own default,
+        Retry.DEFAULT_ALLOWED_METHODS
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # method_whitelist was renamed to allowed_methods and is gone as of
+    # urllib3 2.0, keep accepting it from existing entities
+    if 'method_whitelist' in kwargs:
+        kwargs.setdefault('allowed_methods', kwargs.pop('method_whitelist'))
+
+    retryConfig: Retry = Retry(total=total,
+                               status_forcelist=status_forcelist,
+                               backoff_factor=backoff_factor,
+                               raise_on_redirect=False,
+                               **kwargs)
+    return HTTPAdapter(max_retries=retryConfig,
+                       pool_connections=_POOL_CONNECTIONS,
+                       pool_maxsize=_POOL_MAXSIZE)
+
+
+def _isIterable(value) -> bool:
+    """Checks for the common concrete types before falling back to the
+        (slower) Iterable ABC check
+    """
+    return isinstance(value, (list, tuple, set)) or isinstance(value, Iterable)
+
 
 class PlayerState(Enum):
     running = 0
@@ -41,8 +88,17 @@ class ConsoleInterface(object):
             directoryHandler: The handler for file system functions
             rpc_client: RPC Client instance
             config: The config for this console instance
+            creator: The name of the entity using this console, which is
+                recorded as the creator of anything it adds
 
     """
+    __slots__ = ('_id', '_cloneID', '_directoryHandler', '_rpc', '_async',
+                 '_config_', '_creator', '_session', '_sessionConfig',
+                 '_sessionRetryConfig', '_sessionLock')
+
+    # Whether facts and hyps added by this console need parents
+    _requireParentage: bool = True
+
     def __init__(self, **kwargs) -> None:
         try:
             self._id: str = kwargs['id']
@@ -52,6 +108,7 @@ class ConsoleInterface(object):
             self._rpc: RPCClient = kwargs['rpc_client']
             self._async: SimpleNamespace = kwargs['asyncData']
             self._config_: Union[str, Dict, None] = kwargs.get('config', None)
+            self._creator: str = kwargs['creator']
         except KeyError:
             LOGGER.critical("Expected argument not passed to init",
                             exc_info=True)
@@ -60,24 +117,11 @@ class ConsoleInterface(object):
         self._session: Optional[Session] = None
         self._sessionConfig: Dict = dict()
         self._sessionRetryConfig: Dict = dict()
+        self._sessionLock: threading.Lock = threading.Lock()
         # Setup RPC handler for the console
 
-    def __getSession(self, total: int = 5,
-                     status_forcelist: Optional[Collection[int]] = None,
-                     backoff_factor: float = 0.2,
-                     method_whitelist: Optional[Collection[str]] =
-                     Retry.DEFAULT_METHOD_WHITELIST,
-                     **kwargs: str) -> Session:
-
-        # XXX TODO Retry.DEFAULT_METHOD_WHITELIST is deprecated in favor
-        # of Retry.DEFAULT_METHODS_ALLOWED and method_whitelist is deprecated
-        # in favor of allowed_methods, both of which do not seem to exist in
-        # the version of urllib that gets pulled in
-        retryConfig: Retry = Retry(total=total,
-                                   status_forcelist=status_forcelist,
-                                   backoff_factor=backoff_factor,
-                                   method_whitelist=method_whitelist,
-                                   raise_on_redirect=False, **kwargs)
+    def __getSession(self) -> Session:
+        from requests import Session
 
         session: Session = Session()
 
@@ -97,8 +141,9 @@ class ConsoleInterface(object):
             except Exception:
                 LOGGER.exception("Unable to configure session as expected")
 
-        session.mount('http://', HTTPAdapter(max_retries=retryConfig))
-        session.mount('https://', HTTPAdapter(max_retries=retryConfig))
+        adapter: HTTPAdapter = _buildAdapter(**self._sessionRetryConfig)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
 
         return session
 
@@ -132,18 +177,32 @@ class ConsoleInterface(object):
             http://docs.python-requests.org/en/master/api/#request-sessions for
             more information
         """
-        if self._session is None:
-            self._session = self.__getSession(**self._sessionRetryConfig)
-        return self._session
+        session: Optional[Session] = self._session
+        if session is None:
+            # Entities may share their console with worker threads, only
+            # one of them should build the session
+            with self._sessionLock:
+                session = self._session
+                if session is None:
+                    session = self.__getSession()
+                    self._session = session
+        return session
 
     def configureRequestsRetry(self, **kwargs) -> None:
         """Configuration options for the Retry class
 
             This function allows you to customize the behavior of the Retry
             object which is attached to the HTTPAdapter as part of the session
-            configuration.
+            configuration. The methods to retry are set with allowed_methods,
+            the older method_whitelist name is still accepted.
         """
+        # Re-applying the same configuration keeps the current session
+        if kwargs == self._sessionRetryConfig:
+            return
+
         self._sessionRetryConfig = kwargs
+        # Set old session to None so it will be recreated on next access
+        self._session = None
 
     def configureRequestsSession(self, config: Dict) -> None:
         """Configuration options for Session object
@@ -154,14 +213,22 @@ class ConsoleInterface(object):
         if not isinstance(config, dict):
             raise TypeError("Expected dict type")
 
-        # Check that fields at least exist
-        session = Session()
-        for key in config.keys():
-            if getattr(session, key, None) is None:
+        from requests import Session
+
+        # Check that fields at least exist, against the attributes requests
+        # itself lists for a Session instead of building a throwaway one
+        for key in config:
+            if key not in Session.__attrs__:
                 raise ValueError("Unable to find %s in requests Session"
                                  % (key))
 
-        self._sessionConfig = config
+        # Re-applying the same configuration keeps the current session
+        if config == self._sessionConfig:
+            return
+
+        # Keep a copy, so later changes to the caller's dict are seen as a
+        # new configuration when re-applied
+        self._sessionConfig = dict(config)
         # Set old session to None so it will be recreated on next access
         self._session = None
 
@@ -200,16 +267,13 @@ class ConsoleInterface(object):
 
             Returns: The object id
         """
-        if (parentObjects is not None
-                and not isinstance(parentObjects, Iterable)):
+        if parentObjects is not None and not _isIterable(parentObjects):
             raise ValueError("parent objects must be a list")
 
-        if (parentFacts is not None
-                and not isinstance(parentFacts, Iterable)):
+        if parentFacts is not None and not _isIterable(parentFacts):
             raise ValueError("parent facts must be a list")
 
-        if (parentHyps is not None
-                and not isinstance(parentHyps, Iterable)):
+        if parentHyps is not None and not _isIterable(parentHyps):
             raise ValueError("parent hypotheses must be a list")
 
         resp: RPCResponse = self._rpc.sendAndWait(
@@ -282,32 +346,6 @@ class ConsoleInterface(object):
 
         return resp
 
-
-class BackStoryConsole(ConsoleInterface):
-    """Object passed to backstories to interface with the game
-
-        Args:
-            id: The id of this console/instance
-            directoryHandler: The handler for file system functions
-            rpc_client: Instance of the RPCClient
-            config: The config for this console instance
-            backstorytracker: The internal tracker class for this backstory
-
-    """
-    def __init__(self, **kwargs):
-        super().__init__(id=kwargs['id'],
-                         directoryHandler=kwargs['directoryHandler'],
-                         rpc_client=kwargs['rpc_client'],
-                         asyncData=kwargs['asyncData'],
-                         config=kwargs.get('config'))
-
-        self.__tracker_: Tracker.BackStoryTracker = kwargs['tracker']
-
-    @property
-    def memory(self) -> Dict:
-        """Property to store backstory-level memory"""
-        return self.__tracker_.memory
-
     def addObject(self, object_data: bytes,
                   parentObjects: Optional[List[FileObject]] = None,
                   parentFacts: Optional[List[Fact]] = None,
@@ -320,10 +358,9 @@ class BackStoryConsole(ConsoleInterface):
 
             Returns: The object id
         """
-        resp: RPCResponse = super()._addObject(object_data,
-                                               self.__tracker_.name,
-                                               parentObjects, parentFacts,
-                                               parentHyps, metadata, encoding)
+        resp: RPCResponse = self._addObject(object_data, self._creator,
+                                            parentObjects, parentFacts,
+                                            parentHyps, metadata, encoding)
 
         return resp.result.object_id
 
@@ -337,7 +374,8 @@ class BackStoryConsole(ConsoleInterface):
 
             Raises: ValueError if object id and reference are not set
         """
-        super()._addFact(fact, self.__tracker_.name, require_parentage=False)
+        self._addFact(fact, self._creator,
+                      require_parentage=self._requireParentage)
 
     def addHyp(self, hyp: Fact) -> None:
         """Adds an item to the hyp table
@@ -349,76 +387,68 @@ class BackStoryConsole(ConsoleInterface):
 
             Raises: ValueError if object id and reference are not set
         """
-        super()._addHyp(hyp, self.__tracker_.name, require_parentage=False)
+        self._addHyp(hyp, self._creator,
+                     require_parentage=self._requireParentage)
 
 
-class NPCConsole(ConsoleInterface):
-    """Object passed to npcs to interface with the game
+class BackStoryConsole(ConsoleInterface):
+    """Object passed to backstories to interface with the game
 
         Args:
             id: The id of this console/instance
             directoryHandler: The handler for file system functions
             rpc_client: Instance of the RPCClient
             config: The config for this console instance
-            npctracker: The internal tracker class for this npc
+            backstorytracker: The internal tracker class for this backstory
 
     """
+    __slots__ = ('__tracker_',)
+    # Backstories seed the game, what they add has no parents
+    _requireParentage = False
+
     def __init__(self, **kwargs):
         super().__init__(id=kwargs['id'],
                          directoryHandler=kwargs['directoryHandler'],
                          rpc_client=kwargs['rpc_client'],
                          asyncData=kwargs['asyncData'],
-                         config=kwargs.get('config'))
+                         config=kwargs.get('config'),
+                         creator=kwargs['tracker'].name)
 
-        self.__tracker_: Tracker.NPCTracker = kwargs['tracker']
+        self.__tracker_: Tracker.BackStoryTracker = kwargs['tracker']
 
     @property
     def memory(self) -> Dict:
-        """Property to store npc-level memory"""
+        """Property to store backstory-level memory"""
         return self.__tracker_.memory
 
-    def addObject(self, object_data: bytes,
-                  parentObjects: Optional[List[FileObject]] = None,
-                  parentFacts: Optional[List[Fact]] = None,
-                  parentHyps: Optional[List[Fact]] = None,
-                  metadata: Dict = None, encoding: str = None) -> int:
-        """Adds an object to the object list
-
-            Args:
-                object_data: The data of the object
-
-            Returns: The object id
-        """
-        resp: RPCResponse = super()._addObject(object_data,
-                                               self.__tracker_.name,
-                                               parentObjects, parentFacts,
-                                               parentHyps, metadata, encoding)
-
-        return resp.result.object_id
-
-    def addFact(self, fact: Fact) -> None:
-        """Adds an item to the fact table
-
-            Args:
-                fact: The fact to add to the table
 
-            Returns: None
+class NPCConsole(ConsoleInterface):
+    """Object passed to npcs to interface with the game
 
-            Raises: ValueError if object id and reference are not set
-        """
-        super()._addFact(fact, self.__tracker_.name)
+        Args:
+            id: The id of this console/instance
+            directoryHandler: The handler for file system functions
+            rpc_client: Instance of the RPCClient
+            config: The config for this console instance
+            npctracker: The internal tracker class for this npc
 
-    def addHyp(self, hyp: Fact) -> None:
-        """Adds an item to the hyp table
+    """
+    __slots__ = ('__tracker_',)
 
-            Args:
-                hyp: The hyp to add to the table
+    def __init__(self, **kwargs):
+        super().__init__(id=kwargs['id'],
+                         directoryHandler=kwargs['directoryHandler'],
+                         rpc_client=kwargs['rpc_client'],
+                         asyncData=kwargs['asyncData'],
+                         config=kwargs.get('config'),
+                         creator=kwargs['tracker'].name)
 
-            Returns: None
+        self.__tracker_: Tracker.NPCTracker = kwargs['tracker']
 
-            Raises: ValueError if object id and reference are not set
-        """
-        super()._addHyp(hyp, self.__tracker_.name)
+    @property
+    def memory(self) -> Dict:
+        """Property to store npc-level memory"""
+        return self.__tracker_.memory
 
 
 class PlayerConsole(ConsoleInterface):
@@ -431,13 +461,16 @@ class PlayerConsole(ConsoleInterface):
             config: The config for this console instance
             tracker: The internal tracker of a player
     """
+    __slots__ = ('__tainted_', '__tracker_')
+
     def __init__(self, **kwargs):
         super().__init__(id=kwargs['id'],
                          directoryHandler=kwargs['directoryHandler'],
                          rpc_client=kwargs['rpc_client'],
                          asyncData=kwargs['asyncData'],
                          cloneID=kwargs['clone_id'],
-                         config=kwargs.get('config', None))
+                         config=kwargs.get('config', None),
+                         creator=kwargs['tracker'].name)
 
         self.__tainted_: bool = kwargs['tainted']
         self.__tracker_: Tracker.PlayerTracker = kwargs['tracker']
@@ -451,22 +484,27 @@ class PlayerConsole(ConsoleInterface):
         return self.__tracker_.memory
 
     @property
-    def __clone_(self) -> Optional[str]:
+    def __clone_(self) -> Tracker.CloneTracker:
         return self.__tracker_.clones[self._cloneID]
 
     @property
     def data(self) -> bytes:
         return self.__tracker_.cloneMemory[self._cloneID]
 
+    @staticmethod
+    def _setCloneWaiting(clone: Tracker.CloneTracker) -> None:
+        clone._state = PlayerState.waiting
+
+    @staticmethod
+    def _setCloneRunning(clone: Tracker.CloneTracker) -> None:
+        clone._state = PlayerState.running
+        clone._turnStart = time.time()
+
     def setWaiting(self) -> None:
-        self.__tracker_.clones[self._cloneID] \
-            ._state = PlayerState.waiting
+        self._setCloneWaiting(self.__clone_)
 
     def setRunning(self) -> None:
-        self.__tracker_.clones[self._cloneID] \
-            ._state = PlayerState.running
-        self.__tracker_.clones[self._cloneID] \
-            ._turnStart = time.time()
+        self._setCloneRunning(self.__clone_)
 
     def getClones(self) -> None:
         pass
@@ -555,26 +593,30 @@ class PlayerConsole(ConsoleInterface):
         return resp.result.hyp_list
 
     def _waitOn(self, stream_id: int) -> Generator[RPCResponse, None, None]:
+        # The clone doesn't change while waiting, so look it up once
+        # instead of on every state change, see setWaiting/setRunning
+        clone: Tracker.CloneTracker = self.__clone_
+
         # Set the state to waiting before entering the loop
         # since the generator will block
-        self.setWaiting()
+        self._setCloneWaiting(clone)
 
         try:
             for msg in self._rpc.getStream(stream_id):
                 try:
                     # Set the state to running while the player
                     # does stuff with the yielded info
-                    self.setRunning()
+                    self._setCloneRunning(clone)
                     yield msg
                 finally:
                     # Ensure player state is set back to waiting
                     # in preparation for being blocked
-                    self.setWaiting()
+                    self._setCloneWaiting(clone)
         finally:
             self._rpc.stopStream(stream_id)
             # Ensure player state is set back to running
             # after this function/generator exits
-            self.setRunning()
+            self._setCloneRunning(clone)
 
     def waitOnFacts(self, facts: Union[str, List[str]],
                     only_latest: bool = False) -> Generator[Fact, None, None]:
@@ -610,6 +652,19 @@ class PlayerConsole(ConsoleInterface):
         for msg in self._waitOn(stream_id):
             yield msg.result.hyp
 
+    @staticmethod
+    def _checkWaitTarget(object_id: Optional[int], fact_id: Optional[int],
+                         hyp_id: Optional[int]) -> None:
+        """Checks exactly one of the ids to wait on children of is given"""
+        given: int = ((object_id is not None) + (fact_id is not None)
+                      + (hyp_id is not None))
+        if given == 0:
+            raise ValueError(("One of object_id, fact_id, or hyp_id must "
+                              "be used"))
+        if given > 1:
+            raise ValueError(("Only one of object id, fact_id, or hyp_id "
+                              "may be used"))
+
     def waitOnChildFacts(self, object_id: Optional[int] = None,
                          fact_id: Optional[int] = None,
                          hyp_id: Optional[int] = None,
@@ -620,13 +675,7 @@ class PlayerConsole(ConsoleInterface):
             hyp id until player breaks out of generator
         """
 
-        if all(item is None for item in [object_id, fact_id, hyp_id]):
-            raise ValueError(("One of object_id, fact_id, or hyp_id must "
-                              "be used"))
-
-        if sum(item is not None for item in [object_id, fact_id, hyp_id]) > 1:
-            raise ValueError(("Only one of object id, fact_id, or hyp_id "
-                              "may be used"))
+        self._checkWaitTarget(object_id, fact_id, hyp_id)
 
         if facts is None:
             raise TypeError("'facts' is a required argument")
@@ -656,13 +705,7 @@ class PlayerConsole(ConsoleInterface):
             or hypothesis id until player breaks out of generator
         """
 
-        if all(item is None for item in [object_id, fact_id, hyp_id]):
-            raise ValueError(("One of  object_id, fact_id, or hyp_id must "
-                              "be used"))
-
-        if sum(item is not None for item in [object_id, fact_id, hyp_id]) > 1:
-            raise ValueError(("Only one of object id, fact_id, or hyp_id "
-                              "maybe used"))
+        self._checkWaitTarget(object_id, fact_id, hyp_id)
 
         if types is None:
             raise TypeError("'types' is a required argument")
@@ -691,13 +734,7 @@ class PlayerConsole(ConsoleInterface):
             hypothesis id
         """
 
-        if all(item is None for item in [object_id, fact_id, hyp_id]):
-            raise ValueError(("One of  object_id, fact_id, or hyp_id must "
-                              "be used"))
-
-        if sum(item is not None for item in [object_id, fact_id, hyp_id]) > 1:
-            raise ValueError(("Only one of object id, fact_id, or hyp_id "
-                              "maybe used"))
+        self._checkWaitTarget(object_id, fact_id, hyp_id)
 
         stream_id: int = self._rpc.startStream(
             command=RPCStreamCommands.childObjectStream,
@@ -738,22 +775,6 @@ class PlayerConsole(ConsoleInterface):
             raise WaitTimeoutError()
             # TODO FIXME XXX
 
-    def addObject(self, object_data: bytes,
-                  parentObjects: Optional[List[FileObject]] = None,
-                  parentFacts: Optional[List[Fact]] = None,
-                  parentHyps: Optional[List[Fact]] = None,
-                  metadata: Dict = None, encoding: str = None) -> int:
-        """Adds an object to the object list
-
-            returns the object id
-        """
-        resp = super()._addObject(object_data,
-                                  self.__tracker_.name,
-                                  parentObjects, parentFacts, parentHyps,
-                                  metadata, encoding)
-
-        return resp.result.object_id
-
     def addFact(self, fact: Fact, yesreally: bool = False) -> None:
         """Adds an item to the fact table
 
@@ -769,18 +790,4 @@ class PlayerConsole(ConsoleInterface):
             raise ValueError(("Adding a fact based on a hypothesis, requires "
                               "the 'yesreally' argument to be set to True"))
 
-        super()._addFact(fact, self.__tracker_.name)
-
-    def addHyp(self, hyp: Fact) -> None:
-        """Adds an item to the hyp table
-
-            Args:
-                hyp - The hyp object to add to the table
-
-            Returns: None
-
-            Raises: ValueError if object id and reference are not set
-        """
-
-        hyp._taint()
-        super()._addHyp(hyp, self.__tracker_.name)
+        super().addFact(fact)
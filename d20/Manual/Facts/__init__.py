@@ -3,13 +3,16 @@ import time
 import inspect
 from collections.abc import Iterable
 from collections import OrderedDict
-from typing import Callable, List, Dict, Optional, Set, Union, Tuple, Type
+from types import MappingProxyType
+from typing import (Callable, List, Dict, Mapping, Optional, Set, Union,
+                    Tuple, Type)
 
 from inspect import Parameter, Signature
 from .Fields import FactField
 
 from d20.Manual.Logger import logging, Logger
-from d20.Manual.Utils import loadExtras
+from d20.Manual.Utils import (attrSetter, idList, idSetOrEmpty, idSetSetter,
+                              loadExtras)
 
 
 LOGGER: Logger = logging.getLogger(__name__)
@@ -37,7 +40,7 @@ def isFact(arg: str) -> bool:
 def isFactGroup(arg: str) -> bool:
     """Function to determine whether a string is a registered fact group
     """
-    if arg in RegisteredFactGroups.keys():
+    if arg in RegisteredFactGroups:
         return True
 
     return False
@@ -59,7 +62,7 @@ def resolveFacts(*args) -> List[str]:
         facts = args
     resolved: List[str] = []
     for fact in facts:
-        if fact in RegisteredFactGroups.keys():
+        if fact in RegisteredFactGroups:
             resolved.extend(RegisteredFactGroups[fact])
         elif fact in RegisteredFacts:
             resolved.append(fact)
@@ -109,7 +112,7 @@ def registerFact(*args: str, **kwargs: str) -> Callable:
             for fact_group in args:
                 if not isinstance(fact_group, str):
                     raise TypeError("fact groups must be a 'str' type")
-                if fact_group not in RegisteredFactGroups.keys():
+                if fact_group not in RegisteredFactGroups:
                     RegisteredFactGroups[fact_group] = set()
 
                 RegisteredFactGroups[fact_group].add(cls._type_)
@@ -192,6 +195,24 @@ class _FactMeta_(type):
         return clsobj
 
 
+# Fact keyword argument name -> setter(fact, value, trusted)
+_FACT_KWARGS: Mapping[str, Callable] = MappingProxyType({
+    '_id_': attrSetter('_id_'),
+    '_tainted_': attrSetter('_tainted_'),
+    '_creator_': attrSetter('_creator_'),
+    '_created_': attrSetter('_created_'),
+    '_parentObjects_': idSetSetter('_parentObjects_', "parent objects"),
+    'parentObjects': idSetSetter('_parentObjects_', "parent objects"),
+    '_parentFacts_': idSetSetter('_parentFacts_', "parent facts"),
+    'parentFacts': idSetSetter('_parentFacts_', "parent facts"),
+    '_parentHyps_': idSetSetter('_parentHyps_', "parent hypotheses"),
+    'parentHyps': idSetSetter('_parentHyps_', "parent hypotheses"),
+    '_childObjects_': idSetSetter('_childObjects_', "child objects"),
+    '_childFacts_': idSetSetter('_childFacts_', "child facts"),
+    '_childHyps_': idSetSetter('_childHyps_', "child hypotheses"),
+})
+
+
 class Fact(metaclass=_FactMeta_):
     """Base class for all Fact types
 
@@ -237,7 +258,8 @@ class Fact(metaclass=_FactMeta_):
                     "parentHyps",
                     "_childObjects_",
                     "_childFacts_",
-                    "_childHyps_"]
+                    "_childHyps_",
+                    "_trusted_"]
     __signature__: Signature
 
     def __init__(self, *args, **kwargs) -> None:
@@ -254,87 +276,27 @@ class Fact(metaclass=_FactMeta_):
             setattr(self, name, val)
 
         self._id_: Optional[int] = None
-        self._parentObjects_ = set()
-        self._parentFacts_ = set()
-        self._parentHyps_ = set()
-        self._childObjects_ = set()
-        self._childFacts_ = set()
-        self._childHyps_ = set()
-
-        self._creator_ = None
-        self._created_ = time.time()
+        # Edge sets are only allocated once an edge is added
+        self._parentObjects_: Optional[Set[int]] = None
+        self._parentFacts_: Optional[Set[int]] = None
+        self._parentHyps_: Optional[Set[int]] = None
+        self._childObjects_: Optional[Set[int]] = None
+        self._childFacts_: Optional[Set[int]] = None
+        self._childHyps_: Optional[Set[int]] = None
+
+        self._creator_: Optional[str] = None
+        # Loaded facts carry their own timestamp, don't read the clock
+        if '_created_' not in kwargs:
+            self._created_ = time.time()
+
+        # Id sets coming from a save state were already validated
+        trusted: bool = kwargs.pop('_trusted_', False)
 
         for (name, value) in kwargs.items():
-            if name == '_id_':
-                self._id_ = value
-            elif name == '_tainted_':
-                self._tainted_ = value
-            elif name == '_creator_':
-                self._creator_ = value
-            elif name == '_created_':
-                self._created_ = value
-            elif name in ['_parentObjects_', 'parentObjects']:
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int)
-                                   for i in list(value)):
-                            raise TypeError(("parent objects must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._parentObjects_ = set(value)
-            elif name in ['_parentFacts_', 'parentFacts']:
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int)
-                                   for i in list(value)):
-                            raise TypeError(("parent facts must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._parentFacts_ = set(value)
-            elif name in ['_parentHyps_', 'parentHyps']:
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int)
-                                   for i in list(value)):
-                            raise TypeError(("parent hypotheses must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._parentHyps_ = set(value)
-            elif name == '_childObjects_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int)
-                                   for i in list(value)):
-                            raise TypeError(("child objects must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._childObjects_ = set(value)
-            elif name == '_childFacts_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int)
-                                   for i in list(value)):
-                            raise TypeError(("child facts must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._childFacts_ = set(value)
-            elif name == '_childHyps_':
-                if value is not None:
-                    try:
-                        if not all(isinstance(i, int)
-                                   for i in list(value)):
-                            raise TypeError(("child hypotheses must be a "
-                                             "list of ints"))
-                    except TypeError:
-                        raise
-                    self._childHyps_ = set(value)
-            else:
+            setter: Optional[Callable] = _FACT_KWARGS.get(name)
+            if setter is None:
                 raise TypeError("%s is an invalid keyword argument" % (name))
+            setter(self, value, trusted)
 
     def _setID(self, id: int) -> None:
         self._id_ = id
@@ -345,63 +307,105 @@ class Fact(metaclass=_FactMeta_):
 
     @property
     def parentObjects(self) -> List[int]:
-        return list(self._parentObjects_)
+        return idList(self._parentObjects_)
 
     def addParentObject(self, parent: int) -> None:
+        if self._parentObjects_ is None:
+            self._parentObjects_ = set()
         self._parentObjects_.add(parent)
 
     def remParentObject(self, parent: int) -> None:
-        self._parentObjects_.discard(parent)
+        if self._parentObjects_ is not None:
+            self._parentObjects_.discard(parent)
+
+    def hasParentObject(self, parent: int) -> bool:
+        return (self._parentObjects_ is not None
+                and parent in self._parentObjects_)
 
     @property
     def parentFacts(self) -> List[int]:
-        return list(self._parentFacts_)
+        return idList(self._parentFacts_)
 
     def addParentFact(self, parent: int) -> None:
+        if self._parentFacts_ is None:
+            self._parentFacts_ = set()
         self._parentFacts_.add(parent)
 
     def remParentFact(self, parent: int) -> None:
-        self._parentFacts_.discard(parent)
+        if self._parentFacts_ is not None:
+            self._parentFacts_.discard(parent)
+
+    def hasParentFact(self, parent: int) -> bool:
+        return (self._parentFacts_ is not None
+                and parent in self._parentFacts_)
 
     @property
     def parentHyps(self) -> List[int]:
-        return list(self._parentHyps_)
+        return idList(self._parentHyps_)
 
     def addParentHyp(self, parent: int) -> None:
+        if self._parentHyps_ is None:
+            self._parentHyps_ = set()
         self._parentHyps_.add(parent)
 
     def remParentHyp(self, parent: int) -> None:
-        self._parentHyps_.discard(parent)
+        if self._parentHyps_ is not None:
+            self._parentHyps_.discard(parent)
+
+    def hasParentHyp(self, parent: int) -> bool:
+        return (self._parentHyps_ is not None
+                and parent in self._parentHyps_)
 
     @property
     def childObjects(self) -> List[int]:
-        return list(self._childObjects_)
+        return idList(self._childObjects_)
 
     def addChildObject(self, child: int) -> None:
+        if self._childObjects_ is None:
+            self._childObjects_ = set()
         self._childObjects_.add(child)
 
     def remChildObject(self, child: int) -> None:
-        self._childObjects_.discard(child)
+        if self._childObjects_ is not None:
+            self._childObjects_.discard(child)
+
+    def hasChildObject(self, child: int) -> bool:
+        return (self._childObjects_ is not None
+                and child in self._childObjects_)
 
     @property
     def childFacts(self) -> List[int]:
-        return list(self._childFacts_)
+        return idList(self._childFacts_)
 
     def addChildFact(self, child: int) -> None:
+        if self._childFacts_ is None:
+            self._childFacts_ = set()
         self._childFacts_.add(child)
 
     def remChildFact(self, child: int) -> None:
-        self._childFacts_.discard(child)
+        if self._childFacts_ is not None:
+            self._childFacts_.discard(child)
+
+    def hasChildFact(self, child: int) -> bool:
+        return (self._childFacts_ is not None
+                and child in self._childFacts_)
 
     @property
     def childHyps(self) -> List[int]:
-        return list(self._childHyps_)
+        return idList(self._childHyps_)
 
     def addChildHyp(self, child: int) -> None:
+        if self._childHyps_ is None:
+            self._childHyps_ = set()
         self._childHyps_.add(child)
 
     def remChildHyp(self, child: int) -> None:
-        self._childHyps_.discard(child)
+        if self._childHyps_ is not None:
+            self._childHyps_.discard(child)
+
+    def hasChildHyp(self, child: int) -> bool:
+        return (self._childHyps_ is not None
+                and child in self._childHyps_)
 
     @property
     def factType(self) -> Optional[str]:
@@ -444,12 +448,12 @@ class Fact(metaclass=_FactMeta_):
 
     @property
     def _internalFacts(self) -> Dict:
-        data = {"_parentObjects_": self._parentObjects_,
-                "_parentFacts_": self._parentFacts_,
-                "_parentHyps_": self._parentHyps_,
-                "_childObjects_": self._childObjects_,
-                "_childFacts_": self._childFacts_,
-                "_childHyps_": self._childHyps_}
+        data = {"_parentObjects_": idSetOrEmpty(self._parentObjects_),
+                "_parentFacts_": idSetOrEmpty(self._parentFacts_),
+                "_parentHyps_": idSetOrEmpty(self._parentHyps_),
+                "_childObjects_": idSetOrEmpty(self._childObjects_),
+                "_childFacts_": idSetOrEmpty(self._childFacts_),
+                "_childHyps_": idSetOrEmpty(self._childHyps_)}
         return data
 
     @property
@@ -474,7 +478,7 @@ class Fact(metaclass=_FactMeta_):
     @classmethod
     def load(cls, **kwargs) -> 'Fact':
         del kwargs["_class_"]
-        return cls(**kwargs)
+        return cls(**kwargs, _trusted_=True)
 
 
 def getFactClass(name: str) -> Type['Fact']:
@@ -14,7 +14,6 @@ from d20.version import (
     GAME_ENGINE_VERSION,
     parseVersion)
 from d20.Manual.Exceptions import (ConfigNotFoundError, PlayerCreationError,
-                                   DuplicateObjectError,
                                    TemporaryDirectoryError)
 from d20.Manual.Logger import logging, Logger
 from d20.Manual.Trackers import (NPCTracker,
@@ -296,7 +295,7 @@ class GameMaster(object):
             backstory_id: int = len(self.backstories)
             category: str = backstory.registration.category
 
-            if category not in self.backstory_categories.keys():
+            if category not in self.backstory_categories:
                 self.backstory_categories[
                     category] = BackStoryCategoryTracker(category)
 
@@ -712,13 +711,13 @@ class GameMaster(object):
             args = stream_msg.stream.args
             if isinstance(args, Namespace):
                 if (args.object_id is not None and
-                        args.object_id not in fact.parentObjects):
+                        not fact.hasParentObject(args.object_id)):
                     return False
                 elif (args.fact_id is not None and
-                        args.fact_id not in fact.parentFacts):
+                        not fact.hasParentFact(args.fact_id)):
                     return False
                 elif (args.hyp_id is not None and
-                        args.hyp_id not in fact.parentHyps):
+                        not fact.hasParentHyp(args.hyp_id)):
                     return False
             else:
                 return False
@@ -737,13 +736,13 @@ class GameMaster(object):
             args = stream_msg.stream.args
             if isinstance(args, Namespace):
                 if (args.object_id is not None and
-                        args.object_id not in hyp.parentObjects):
+                        not hyp.hasParentObject(args.object_id)):
                     return False
                 elif (args.fact_id is not None and
-                        args.fact_id not in hyp.parentFacts):
+                        not hyp.hasParentFact(args.fact_id)):
                     return False
                 elif (args.hyp_id is not None and
-                        args.hyp_id not in hyp.parentHyps):
+                        not hyp.hasParentHyp(args.hyp_id)):
                     return False
             else:
                 return False
@@ -762,13 +761,13 @@ class GameMaster(object):
             args = stream_msg.stream.args
             if isinstance(args, Namespace):
                 if (args.object_id is not None and
-                        args.object_id not in obj.parentObjects):
+                        not obj.hasParentObject(args.object_id)):
                     return False
                 elif (args.fact_id is not None and
-                        args.fact_id not in obj.parentFacts):
+                        not obj.hasParentFact(args.fact_id)):
                     return False
                 elif (args.hyp_id is not None and
-                        args.hyp_id not in obj.parentHyps):
+                        not obj.hasParentHyp(args.hyp_id)):
                     return False
             else:
                 return False
@@ -952,9 +951,9 @@ class GameMaster(object):
             self.rpc.sendErrorResponse(msg, reason=str(e))
             return
 
-        isduplicate: bool = False
+        FileObj: Optional[FileObject]
         try:
-            FileObj: Optional[FileObject] = self.objects.addObject(
+            (FileObj, added) = self.objects.getOrAddObject(
                 object_data,
                 _creator_=creator,
                 _parentObjects_=parentObjects,
@@ -962,9 +961,7 @@ class GameMaster(object):
                 _parentHyps_=parentHyps,
                 metadata=metadata,
                 encoding=encoding)
-        except DuplicateObjectError:
-            isduplicate = True
-            FileObj = self.objects.getObjectByData(object_data)
+            isduplicate: bool = not added
         except Exception as e:
             self.rpc.sendErrorResponse(
                 msg,
@@ -1228,13 +1225,13 @@ class GameMaster(object):
                     if factColumn is not None:
                         for fact in factColumn:
                             if (object_id is not None and
-                                    object_id not in fact.parentObjects):
+                                    not fact.hasParentObject(object_id)):
                                 continue
                             elif(fact_id is not None and
-                                    fact_id not in fact.parentFacts):
+                                    not fact.hasParentFact(fact_id)):
                                 continue
                             elif(hyp_id is not None and
-                                    hyp_id not in fact.parentHyps):
+                                    not fact.hasParentHyp(hyp_id)):
                                 continue
                             result = {'fact': fact}
                             self.rpc.sendResponse(msg,
@@ -1266,13 +1263,13 @@ class GameMaster(object):
                     if hypColumn is not None:
                         for hyp in hypColumn:
                             if (object_id is not None and
-                                    object_id not in hyp.parentObjects):
+                                    not hyp.hasParentObject(object_id)):
                                 continue
                             elif(fact_id is not None and
-                                    fact_id not in hyp.parentFacts):
+                                    not hyp.hasParentFact(fact_id)):
                                 continue
                             elif(hyp_id is not None and
-                                    hyp_id not in hyp.parentHyps):
+                                    not hyp.hasParentHyp(hyp_id)):
                                 continue
                             result = {'hyp': hyp}
                             self.rpc.sendResponse(msg,
@@ -1300,13 +1297,13 @@ class GameMaster(object):
             if not only_latest:
                 for obj in self.objects:
                     if (object_id is not None and
-                            object_id not in obj.parentObjects):
+                            not obj.hasParentObject(object_id)):
                         continue
                     elif(fact_id is not None and
-                            fact_id not in obj.parentFacts):
+                            not obj.hasParentFact(fact_id)):
                         continue
                     elif(hyp_id is not None and
-                            hyp_id not in obj.parentHyps):
+                            not obj.hasParentHyp(hyp_id)):
                         continue
                     result = {'object': obj}
                     self.rpc.sendResponse(msg,
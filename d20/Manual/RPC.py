@@ -245,7 +245,7 @@ class RPCClient:
                 self.ignores.remove(msg_id)
                 continue
 
-            if msg_id in self.streams.keys():
+            if msg_id in self.streams:
                 self.streams[msg_id].put(resp)
             else:
                 self.msglist[msg_id] = resp
@@ -264,7 +264,7 @@ class RPCClient:
         return request.id
 
     def stopStream(self, stream_id: int) -> None:
-        if stream_id not in self.streams.keys():
+        if stream_id not in self.streams:
             raise RuntimeError("Attempt to stop untracked stream")
 
         request: RPCStopStreamRequest = RPCStopStreamRequest(self.entity,
@@ -279,7 +279,7 @@ class RPCClient:
     def getStream(self, stream_id: int,
                   timeout: Optional[int] = None
                   ) -> Generator[RPCResponse, None, None]:
-        if stream_id not in self.streams.keys():
+        if stream_id not in self.streams:
             raise RuntimeError("Attempt to get untracked stream")
 
         while 1:
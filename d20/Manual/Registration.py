@@ -1,5 +1,6 @@
 from packaging import version as __version
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Optional, List, Dict, Set
 
 import pkg_resources
@@ -9,9 +10,16 @@ from d20.Manual.Facts import (isFactGroup,
 from d20.Manual.Options import Arguments
 
 
+@lru_cache(maxsize=128)
+def _parse_version(version: str):
+    # Components tend to share the same few version strings, so reuse
+    # the parsed (immutable) version objects across registrations
+    return pkg_resources.parse_version(version)
+
+
 def _test_version_string(version: str) -> str:
     try:
-        version_test = pkg_resources.parse_version(version)
+        version_test = _parse_version(version)
         if isinstance(version_test, __version.LegacyVersion):
             raise ValueError("Unparseable version specified")
     except Exception:
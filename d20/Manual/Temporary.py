@@ -108,9 +108,9 @@ class TemporaryObjectOnDisk:
         (handle, self._path) = \
             tempfile.mkstemp(prefix='object-%d.' % (id), dir=self.base)
 
-        os.close(handle)
-
-        with open(self._path, 'wb') as f:
+        # Write through the descriptor mkstemp already opened instead of
+        # closing it and opening the path again
+        with os.fdopen(handle, 'wb') as f:
             if isinstance(data, str):
                 wdata = bytes(data, 'utf-8')
             else:
@@ -125,8 +125,13 @@ class TemporaryObjectOnDisk:
 class TemporaryObjectStream:
     """Object stream management class
 
-        This class returns an instance of io.BytesIO of the object
+        This class returns an instance of io.BytesIO of the object. Every
+        access gets its own stream so readers don't share a position, a
+        BytesIO over bytes shares the buffer until written to so this
+        does not copy the data
     """
+    __slots__ = ('data', 'id')
+
     def __init__(self, id: int, data: bytes, **kwargs) -> None:
         self.data: bytes = data
         self.id: int = id
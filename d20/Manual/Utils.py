@@ -1,7 +1,7 @@
 import os
 import importlib.machinery
 import importlib.util
-from typing import List, Dict, Optional, Set
+from typing import Callable, Iterable, List, Dict, Optional, Set
 
 
 def loadExtras(paths: List[str], loaded: Set, exclude=None,
@@ -55,3 +55,59 @@ def loadExtras(paths: List[str], loaded: Set, exclude=None,
                 raise
             except Exception as e:
                 raise RuntimeError(e)
+
+
+def idSet(value: Iterable, description: str,
+          trusted: bool = False) -> Set[int]:
+    """Converts value into a set of ids, checking each is an int
+
+        The check is skipped for trusted input, e.g., from a save state,
+        whose sets are also adopted instead of copied. save() hands out
+        copies, see idSetOrEmpty, so an adopted set is never shared with
+        the saved entity
+    """
+    ids: Set[int]
+    if trusted and isinstance(value, set):
+        ids = value
+    else:
+        ids = set(value)
+    if not trusted and not all(isinstance(i, int) for i in ids):
+        raise TypeError("%s must be a list of ints" % (description))
+    return ids
+
+
+def attrSetter(attr: str) -> Callable:
+    """Returns a keyword argument setter(obj, value, trusted) for attr"""
+    def _set(obj: object, value, trusted: bool) -> None:
+        setattr(obj, attr, value)
+    return _set
+
+
+def idSetSetter(attr: str, description: str) -> Callable:
+    """Returns a keyword argument setter(obj, value, trusted) which
+        stores value as an id set in attr, see idSet
+    """
+    def _set(obj: object, value: Optional[Iterable],
+             trusted: bool) -> None:
+        if value is not None:
+            setattr(obj, attr, idSet(value, description, trusted))
+    return _set
+
+
+def idList(ids: Optional[Set[int]]) -> List[int]:
+    """Returns a list of the given, possibly unallocated, id set"""
+    if ids is None:
+        return list()
+    return list(ids)
+
+
+def idSetOrEmpty(ids: Optional[Set[int]]) -> Set[int]:
+    """Returns a copy of the given id set, or an empty one if never
+        allocated
+
+        Keeps the save format the same regardless of allocation, and a
+        saved state independent of the (still live) entity it came from
+    """
+    if ids is None:
+        return set()
+    return set(ids)
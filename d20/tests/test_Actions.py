@@ -0,0 +1,113 @@
+import sys
+import unittest
+
+from d20.Actions import (registerAction, setupActionLoader,
+                         ActionRegistrationForm, Config, _Config_,
+                         ACTION_INVENTORY)
+from d20.Manual.Config import Configuration
+from d20.Manual.Options import Arguments
+
+
+@registerAction(
+    name="ActionsTestAction",
+    options=Arguments(
+        ("option1", {'type': int, 'default': 1})
+    )
+)
+class ActionsTestAction(object):
+    pass
+
+
+class TestActionConfig(unittest.TestCase):
+    def test_for_cached(self):
+        config = _Config_(Configuration(
+            config={'Actions': {'ActionsTestAction': {'option1': 2}}}))
+        first = config._for("ActionsTestAction")
+        self.assertDictEqual(first, {'option1': 2, 'common': {}})
+        self.assertIs(config._for("ActionsTestAction"), first)
+
+        config.invalidate("ActionsTestAction")
+        self.assertIsNot(config._for("ActionsTestAction"), first)
+
+    def test_for_unregistered(self):
+        config = _Config_(Configuration(
+            config={'Actions': {'Unregistered': {'foo': 'bar'}}}))
+        self.assertNotIn("Unregistered", ACTION_INVENTORY)
+        self.assertDictEqual(
+            config._for("Unregistered"),
+            {'foo': 'bar', 'common': {}})
+        self.assertNotIn("Unregistered", config._cache)
+
+    def test_for_unregistered_then_registered(self):
+        config = _Config_(Configuration(config={}))
+        self.assertDictEqual(config._for("LateAction"), {'common': {}})
+        try:
+            registerAction(
+                name="LateAction",
+                options=Arguments(("option1", {'type': int, 'default': 1}))
+            )(type('LateAction', (object,), {}))
+            self.assertDictEqual(config._for("LateAction"),
+                                 {'option1': 1, 'common': {}})
+        finally:
+            ACTION_INVENTORY.pop("LateAction", None)
+
+    def test_setup_prewarms_cache(self):
+        original = Config._config_obj_
+        try:
+            setupActionLoader([], Configuration(
+                config={'Actions': {'ActionsTestAction': {'option1': 3}}}))
+            self.assertDictEqual(
+                Config._config_obj_._cache['ActionsTestAction'],
+                {'option1': 3, 'common': {}})
+        finally:
+            Config._config_obj_ = original
+
+
+class TestActionRegistrationForm(unittest.TestCase):
+    def test_defaults(self):
+        reg = ActionRegistrationForm(name="FormTest")
+        self.assertEqual(reg.name, "FormTest")
+        self.assertIsNone(reg.description)
+        self.assertIsInstance(reg.options, Arguments)
+
+    def test_invalid_keyword(self):
+        with self.assertRaises(TypeError) as cm:
+            ActionRegistrationForm(name="FormTest", foo="bar")
+        self.assertEqual(str(cm.exception),
+                         "foo is an invalid keyword argument")
+
+    def test_invalid_options(self):
+        with self.assertRaises(TypeError):
+            ActionRegistrationForm(name="FormTest", options="abc")
+
+    def test_missing_name(self):
+        with self.assertRaises(AttributeError):
+            ActionRegistrationForm(description="FormTest")
+
+    def test_from_decorator(self):
+        options = Arguments(("option1", {'type': bool}))
+        reg = ActionRegistrationForm._from_decorator(
+            "FormTest", "description", options)
+        self.assertEqual(reg.name, "FormTest")
+        self.assertEqual(reg.description, "description")
+        self.assertIs(reg.options, options)
+
+        with self.assertRaises(AttributeError):
+            ActionRegistrationForm._from_decorator(None)
+
+        with self.assertRaises(TypeError):
+            ActionRegistrationForm._from_decorator("FormTest", options="abc")
+
+    def test_register_invalid_keyword(self):
+        with self.assertRaises(TypeError):
+            registerAction(name="FormTest", foo="bar")
+
+
+class TestActionInventory(unittest.TestCase):
+    def test_single_inventory(self):
+        import d20.Actions
+        import d20.Actions.TestAction  # noqa: F401
+
+        self.assertIs(ACTION_INVENTORY, d20.Actions.ACTION_INVENTORY)
+        self.assertIs(sys.modules['d20.Actions'], d20.Actions)
+        self.assertIn("TestAction", ACTION_INVENTORY)
@@ -1,6 +1,10 @@
+import os
+import tempfile
+import threading
 import unittest
 from unittest import mock
 
+from d20.Manual import BattleMap
 from d20.Manual.BattleMap import (TableColumn,
                                   FactTable,
                                   HypothesisTable,
@@ -100,6 +104,27 @@ class BMFactTableTests(unittest.TestCase):
         data = self.facts.save()
         self.assertEqual(data['ids'], 5)
 
+    def test5LoadTable(self):
+        for fact in [MD5HashFact(), MimeTypeFact(), MD5HashFact()]:
+            self.facts.add(fact)
+
+        loaded = FactTable.load(self.facts.save())
+        self.assertEqual(loaded._ids, 3)
+        md5s = loaded.getColumn(MD5HashFact._type_)
+        self.assertEqual([fact.id for fact in md5s], [0, 2])
+        self.assertIs(loaded.findById(2), md5s[1])
+        self.assertEqual(md5s.index(md5s[1]), 1)
+        self.assertEqual(loaded.add(MD5HashFact()), 3)
+
+        # Loading within the same process doesn't share edge sets
+        self.facts.findById(0).addChildFact(1)
+        loaded = FactTable.load(self.facts.save())
+        loaded.findById(0).addChildFact(2)
+        self.assertEqual(self.facts.findById(0).childFacts, [1])
+
+        with self.assertRaises(TypeError):
+            HypothesisTable.load(self.facts.save())
+
 
 class BMHypTableTests(unittest.TestCase):
     def setUp(self):
@@ -201,6 +226,17 @@ class BMFileObjectTests(unittest.TestCase):
         foo.remChildHyp(1)
         self.assertEqual([], foo.childHyps)
 
+    def testFileObjectHasEdges(self):
+        foo = FileObject(self.data, 0)
+        self.assertFalse(foo.hasParentObject(1))
+        foo.addParentObject(1)
+        foo.addChildHyp(2)
+        self.assertTrue(foo.hasParentObject(1))
+        self.assertFalse(foo.hasParentFact(1))
+        self.assertTrue(foo.hasChildHyp(2))
+        foo.remChildHyp(2)
+        self.assertFalse(foo.hasChildHyp(2))
+
     def test3FileObject(self):
         foo = FileObject(self.data, 0)
         foo.add_metadata('test', 'value')
@@ -219,32 +255,208 @@ class BMFileObjectTests(unittest.TestCase):
         foo.stream
         tempStream.assert_called_once_with(0, self.data)
 
+    def testLazyHash(self):
+        with mock.patch("d20.Manual.BattleMap._sha256",
+                        wraps=BattleMap._sha256) as sha256:
+            foo = FileObject(self.data, 0)
+            sha256.assert_not_called()
+            self.assertEqual(foo.hash, foo.save()['hash'])
+            sha256.assert_called_once_with(self.data)
+
+    def testDigest(self):
+        foo = FileObject(self.data, 0)
+        self.assertEqual(len(foo.digest), 32)
+        self.assertEqual(foo.digest.hex(), foo.hash)
+
+    def testPrecomputedHash(self):
+        digest = BattleMap._sha256(self.data)
+        with mock.patch("d20.Manual.BattleMap._sha256") as sha256:
+            foo = FileObject(self.data, 0, _digest_=digest)
+            self.assertIs(foo.digest, digest)
+            self.assertEqual(foo.hash, digest.hex())
+            sha256.assert_not_called()
+
+        # A hex hash is not accepted as a precomputed hash
+        foo = FileObject(self.data, 0, _hash_='precomputed')
+        self.assertEqual(foo.hash, digest.hex())
+
     def testSaveLoad(self):
         tobj = FileObject(self.data, 0)
         data = tobj.save()
 
         FileObject.load(data)
 
+    def testLoadKeepsCreated(self):
+        data = FileObject(self.data, 0).save()
+        data['_created_'] = 1.0
+        with mock.patch("d20.Manual.BattleMap.time.time") as now:
+            foo = FileObject.load(data)
+            now.assert_not_called()
+        self.assertEqual(foo._created_, 1.0)
+
+    def testByteArrayData(self):
+        foo = FileObject(self.badata, 0)
+        bar = FileObject(self.data, 1)
+        self.assertEqual(foo.hash, bar.hash)
+        self.assertEqual(foo.size, bar.size)
+        self.assertEqual(foo.save()['data'], bar.save()['data'])
+
+        self.assertIsInstance(foo.data, bytes)
+        self.assertEqual(foo.data, self.data)
+        self.assertEqual(foo.stream.read(), self.data)
+
+        badata = bytearray(self.data)
+        foo = FileObject(badata, 0)
+        badata[:] = b'changed'
+        self.assertEqual(foo.data, self.data)
+        self.assertEqual(foo.hash, bar.hash)
+
+    def testMetadataFilename(self):
+        foo = FileObject(self.data, 0,
+                         metadata={'filename': 'C:\\foo\\bar.exe'})
+        self.assertEqual(foo.metadata['filename'], 'bar.exe')
+        self.assertEqual(foo.metadata['filepath'], 'C:\\foo')
+
+        foo = FileObject(self.data, 0, metadata={'filename': '/foo/bar.exe'})
+        self.assertEqual(foo.metadata['filename'], 'bar.exe')
+        self.assertEqual(foo.metadata['filepath'], '/foo')
+
+        foo = FileObject(self.data, 0, metadata={'filename': 'C:'})
+        self.assertEqual(foo.metadata['filename'], 'C:')
+
+    def testMetadataCopy(self):
+        foo = FileObject(self.data, 0,
+                         metadata={'filename': 'foo', 'nested': {'a': [1]}})
+        metadata = foo.metadata
+        metadata['filename'] = 'bar'
+        metadata['nested']['a'].append(2)
+        self.assertEqual(foo.metadata['filename'], 'foo')
+        self.assertEqual(foo.metadata['nested'], {'a': [1]})
+
+    def testLazyEdgeSets(self):
+        foo = FileObject(self.data, 0)
+        self.assertIsNone(foo._childObjects_)
+        self.assertEqual(foo.childObjects, [])
+        foo.remChildObject(1)
+        self.assertIsNone(foo._childObjects_)
+        foo.addChildObject(1)
+        self.assertEqual(foo.childObjects, [1])
+        self.assertEqual(foo.save()['_parentObjects_'], set())
+
+    def testSaveLayout(self):
+        tobj = FileObject(self.data, 0, _parentObjects_=[1],
+                          metadata={'foo': 'bar'})
+        expected = tobj._creationInfo
+        expected.update(tobj._coreInfo)
+        expected.update(tobj._internalInfo)
+        self.assertEqual(tobj.save(), expected)
+
+    def testSaveEncodesData(self):
+        tobj = FileObject(self.data, 0)
+        self.assertEqual(tobj._coreInfo['data'], tobj._encodedData())
+        data = tobj.save()
+        self.assertIsInstance(data['data'], str)
+        self.assertEqual(FileObject.load(data).data, self.data)
+
+    def testLoadDoesNotShareEdgeSets(self):
+        tobj = FileObject(self.data, 0, _parentObjects_=[1])
+        lobj = FileObject.load(tobj.save())
+        lobj.addParentObject(2)
+        self.assertEqual(tobj.parentObjects, [1])
+        tobj.addParentObject(3)
+        self.assertEqual(sorted(lobj.parentObjects), [1, 2])
+
+    def testSaveCopiesEdgeSets(self):
+        tobj = FileObject(self.data, 0, _parentObjects_=[1])
+        data = tobj.save()
+        data['_parentObjects_'].add(2)
+        self.assertEqual(tobj.parentObjects, [1])
+        tobj.addParentObject(3)
+        self.assertEqual(tobj._internalInfo['_parentObjects_'], {1, 3})
+        self.assertEqual(data['_parentObjects_'], {1, 2})
+
+    def testSaveLoadParents(self):
+        tobj = FileObject(self.data, 0, _parentObjects_=[1, 2],
+                          _childFacts_={3})
+        lobj = FileObject.load(tobj.save())
+        self.assertEqual(sorted(lobj.parentObjects), [1, 2])
+        self.assertEqual(lobj.childFacts, [3])
+
 
 class ObjectListTests(unittest.TestCase):
     def setUp(self):
         self.objects = ObjectList()
         self.data = b'testtesttest'
 
-    @mock.patch("os.path")
-    def testObjectListTemp(self, os_path):
-        os_path.exists = mock.Mock(return_value=False)
-        os_path.mkdirs = mock.Mock()
-        os_path.join = mock.Mock(return_value="/var/foo/objects")
-
+    @mock.patch("os.makedirs")
+    def testObjectListTemp(self, makedirs):
         ObjectList(temporary='/var/foo')
-        os_path.exists.assert_called_once_with('/var/foo/objects')
-        os_path.mkdirs.assert_called_once_with('/var/foo/objects')
+        makedirs.assert_called_once_with('/var/foo/objects', exist_ok=True)
+
+    def testObjectListTempCreated(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ObjectList(temporary=tmpdir)
+            self.assertTrue(os.path.isdir(os.path.join(tmpdir, 'objects')))
+            # Already existing directories are fine
+            ObjectList(temporary=tmpdir)
 
     def testObjectList(self):
         obj = self.objects.addObject(self.data)
         self.assertEqual(self.objects.getObjectByData(self.data), obj)
         self.assertEqual(self.objects.getObjectByData(b'no'), None)
+        self.assertIs(self.objects.getObjectByHash(obj.hash), obj)
+        self.assertIsNone(self.objects.getObjectByHash('nothex'))
+
+    def testGetOrAddObject(self):
+        (obj, added) = self.objects.getOrAddObject(self.data)
+        self.assertTrue(added)
+        self.assertEqual(obj.hash, FileObject(self.data, 0).hash)
+
+        with mock.patch("d20.Manual.BattleMap._sha256",
+                        wraps=BattleMap._sha256) as sha256:
+            (dup, added) = self.objects.getOrAddObject(self.data)
+            sha256.assert_called_once_with(self.data)
+        self.assertFalse(added)
+        self.assertIs(dup, obj)
+
+        (dup, added) = self.objects.getOrAddObject(
+            str(self.data, 'utf-8'))
+        self.assertFalse(added)
+        self.assertIs(dup, obj)
+        self.assertEqual(len(self.objects), 1)
+
+    def testGetOrAddObjectValidates(self):
+        self.objects.getOrAddObject(self.data)
+        with self.assertRaises(TypeError):
+            self.objects.getOrAddObject(self.data,
+                                        _parentObjects_=['notint'])
+        self.assertEqual(len(self.objects), 1)
+
+    def testGetOrAddReusedBuffer(self):
+        buf = bytearray(b'first')
+        (obj, added) = self.objects.getOrAddObject(buf)
+        self.assertTrue(added)
+        buf[:] = b'second'
+        self.assertEqual(obj.data, b'first')
+        self.assertEqual(obj.digest, BattleMap._sha256(obj.data))
+
+        (dup, added) = self.objects.getOrAddObject(bytearray(b'first'))
+        self.assertFalse(added)
+        self.assertIs(dup, obj)
+
+    def testAddObjectThreaded(self):
+        threads = [threading.Thread(target=self.objects.addObject,
+                                    args=(b'data%d' % (i),))
+                   for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.objects), 16)
+        for (i, obj) in enumerate(self.objects):
+            self.assertEqual(obj.id, i)
+            self.assertIs(self.objects.getObjectByHash(obj.hash), obj)
 
     def test2ObjectList(self):
         with self.assertRaises(TypeError):
@@ -3,8 +3,10 @@ from unittest import mock
 import yaml
 import copy
 import argparse
+import cerberus
 
-from d20.Manual.Config import (Configuration, EntityConfiguration)
+from d20.Manual.Config import (Configuration, EntityConfiguration,
+                               d20_schema)
 from d20.tests import wrapOut
 
 sampleConfig1String = """---
@@ -65,6 +67,51 @@ class TestConfiguration(unittest.TestCase):
         with self.assertRaises(TypeError):
             Configuration(config=copy.deepcopy(sampleConfig2))
 
+    def test_invalid_then_valid(self):
+        with self.assertRaises(ValueError):
+            Configuration(config={'d20': {'graceTime': 'abc'}})
+        config = Configuration(config={'d20': {'extra-npcs': '/tmp'}})
+        self.assertEqual(config.d20, {'extra_npcs': '/tmp'})
+
+    def test_d20_validation(self):
+        config = Configuration(config={'d20': {
+            'extra-players': ['/tmp/a'],
+            'extra_players': '/tmp/b',
+            'graceTime': 1}})
+        self.assertEqual(config.d20, {'extra_players': ['/tmp/a'],
+                                      'graceTime': 1})
+
+        invalid = [{'foo': 'bar'},
+                   {'graceTime': None},
+                   {'temporary': 1},
+                   {'extra_players': 1},
+                   {'extra-players': ['/tmp', 1]}]
+        for d20 in invalid:
+            with self.assertRaises(ValueError):
+                Configuration(config={'d20': d20})
+
+        with self.assertRaises(TypeError):
+            Configuration(config={'d20': None})
+
+    def test_d20_validation_matches_cerberus(self):
+        configs = [{'extra-players': ('/tmp/a', '/tmp/b')},
+                   {'extra_npcs': ('/tmp/a',), 'temporary': '/tmp'},
+                   {'extra_facts': ('/tmp/a', 1)},
+                   {'extra_facts': set()},
+                   {'graceTime': True, 'maxGameTime': 1.0},
+                   {'temporary': b'/tmp'}]
+        for d20 in configs:
+            validator = cerberus.Validator(dict(d20_schema))
+            if validator.validate(d20):
+                config = Configuration(config={'d20': dict(d20)})
+                self.assertEqual(config.d20, validator.document)
+            else:
+                with self.assertRaises(ValueError) as cm:
+                    Configuration(config={'d20': dict(d20)})
+                self.assertEqual(
+                    str(cm.exception),
+                    "Unable to verify d20 config: %s" % (validator.errors))
+
     def test_arg_injection(self):
         args = argparse.Namespace()
         Configuration(config=copy.deepcopy(sampleConfig1),
@@ -73,6 +120,16 @@ class TestConfiguration(unittest.TestCase):
         self.assertIsInstance(args.extra_players, list)
         self.assertEqual(args.extra_players, ['/opt/d20_extras/Players'])
 
+    def test_arg_injection_extends(self):
+        args = argparse.Namespace(extra_players=['/tmp/players'],
+                                  extra_npcs=None)
+        Configuration(config=copy.deepcopy(sampleConfig1),
+                      args=args)
+        self.assertEqual(args.extra_players,
+                         ['/tmp/players', '/opt/d20_extras/Players'])
+        self.assertEqual(args.extra_npcs, ['/opt/d20_extras/NPCs'])
+        self.assertEqual(args.graceTime, 5)
+
     def test_configfile_not_found(self):
         with wrapOut() as (out, err):
             with self.assertRaises(FileNotFoundError):
@@ -88,18 +145,28 @@ class TestConfiguration(unittest.TestCase):
     def test_read_config(self):
         with mock.patch(
                 "builtins.open",
-                mock.mock_open(read_data=sampleConfig1String)) as mock_open:
-            Configuration(configFile='/tmp/foo')
-            mock_open.assert_called_with('/tmp/foo', 'r')
+                mock.mock_open(
+                    read_data=sampleConfig1String.encode())) as mock_open:
+            config = Configuration(configFile='/tmp/foo')
+            mock_open.assert_called_with('/tmp/foo', 'rb')
+            self.assertEqual(config.players, sampleConfig1['Players'])
 
     def test_read_config_yaml_failure(self):
         with wrapOut() as (out, err):
             with mock.patch(
                     "builtins.open",
-                    mock.mock_open(read_data="foo\t\tfoo")):
+                    mock.mock_open(read_data=b"foo\t\tfoo")):
                 with self.assertRaises(Exception):
                     Configuration(configFile='/tmp/foo')
 
+    def test_read_config_yaml_error(self):
+        with wrapOut() as (out, err):
+            with mock.patch(
+                    "builtins.open",
+                    mock.mock_open(read_data=b"foo: [bar")):
+                with self.assertRaises(yaml.YAMLError):
+                    Configuration(configFile='/tmp/foo')
+
 
 class TestConfigurations(unittest.TestCase):
     def setUp(self):
@@ -117,6 +184,22 @@ class TestConfigurations(unittest.TestCase):
         self.assertIsInstance(self.config0.d20, dict)
         self.assertIsInstance(self.config0.common, dict)
 
+    def test_empty_common(self):
+        config = Configuration(config={'common': None})
+        self.assertEqual(config.common, {})
+        self.assertEqual(config.playerConfig('NoPlayer').common, {})
+
+    def test_sections_resolved_once(self):
+        self.assertIs(self.config0.players, self.config0.players)
+        self.assertIs(self.config1.players, self.config1._config_['Players'])
+
+    def test_entity_config_cached(self):
+        tpconfig = self.config1.playerConfig('TestPlayer')
+        self.assertIs(tpconfig, self.config1.playerConfig('TestPlayer'))
+        self.assertIsNot(tpconfig, self.config1.npcConfig('TestPlayer'))
+        self.assertIs(self.config1.playerConfig('NoPlayer'),
+                      self.config1.playerConfig('NoPlayer'))
+
     def test_player_config(self):
         tpconfig = self.config1.playerConfig('TestPlayer')
         self.assertIsInstance(tpconfig, EntityConfiguration)
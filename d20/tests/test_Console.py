@@ -1,8 +1,10 @@
+import threading
 import unittest
 from unittest import mock
 from argparse import Namespace
 
-from d20.Manual.Console import (ConsoleInterface, NPCConsole, PlayerConsole)
+from d20.Manual.Console import (ConsoleInterface, BackStoryConsole,
+                                NPCConsole, PlayerConsole, PlayerState)
 from d20.Manual.Exceptions import (ConsoleError, WaitTimeoutError)
 from d20.Manual.RPC import (RPCResponse,
                             RPCCommands,
@@ -36,7 +38,8 @@ class TestConsoleInterface(unittest.TestCase):
             directoryHandler=self.dhandler,
             rpc_client=self.rpcClient,
             asyncData=self.asyncData,
-            config=dict())
+            config=dict(),
+            creator="Console Test")
 
     @mock.patch("d20.Manual.Console.LOGGER")
     def testConsoleCreation(self, logger):
@@ -89,6 +92,12 @@ class TestConsoleInterface(unittest.TestCase):
                 b'data', 'creator-test', None, None, None, dict(), None
             )
 
+    def testCreator(self):
+        console = self._createConsole()
+        console.addObject(b'data')
+        (_, kwargs) = self.rpcClient.sendAndWait.call_args
+        self.assertEqual(kwargs['args']['creator'], "Console Test")
+
     def testRequests(self):
         console = ConsoleInterface(
             id=0,
@@ -96,7 +105,8 @@ class TestConsoleInterface(unittest.TestCase):
             rpc_client=self.rpcClient,
             asyncData=self.asyncData,
             config={'http_proxy': 'http://no.such.proxy',
-                    'https_proxy': 'http://no.such.proxy'})
+                    'https_proxy': 'http://no.such.proxy'},
+            creator="Console Test")
 
         console.configureRequestsRetry(**{})
         with self.assertRaises(TypeError):
@@ -105,6 +115,74 @@ class TestConsoleInterface(unittest.TestCase):
             console.configureRequestsSession({'foo': 'bar'})
         console.configureRequestsSession({'verify': True})
         console.requests
+        console.configureRequestsSession({'auth': ('user', 'pass')})
+        self.assertEqual(console.requests.auth, ('user', 'pass'))
+
+    def testReconfigureSession(self):
+        console = self._createConsole()
+        config = {'verify': True}
+        console.configureRequestsSession(config)
+        session = console.requests
+
+        console.configureRequestsSession({'verify': True})
+        self.assertIs(session, console.requests)
+        console.configureRequestsRetry()
+        self.assertIs(session, console.requests)
+
+        config['verify'] = False
+        console.configureRequestsSession(config)
+        self.assertIsNot(session, console.requests)
+        self.assertFalse(console.requests.verify)
+
+        session = console.requests
+        console.configureRequestsRetry(total=1)
+        self.assertIsNot(session, console.requests)
+        self.assertEqual(
+            console.requests.get_adapter('https://localhost')
+            .max_retries.total, 1)
+
+    def testSessionCreatedOnce(self):
+        console = self._createConsole()
+        sessions = list()
+        threads = [threading.Thread(
+                       target=lambda: sessions.append(console.requests))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(sessions), 8)
+        self.assertTrue(all(session is sessions[0] for session in sessions))
+
+    def testAdapter(self):
+        console1 = self._createConsole()
+        console2 = self._createConsole()
+        console1.configureRequestsRetry(total=3, status_forcelist=[500])
+        console2.configureRequestsRetry(total=3, status_forcelist=[500])
+        adapter = console1.requests.get_adapter('https://localhost')
+        self.assertIs(adapter,
+                      console1.requests.get_adapter('http://localhost'))
+        self.assertIsNot(adapter,
+                         console2.requests.get_adapter('https://localhost'))
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertEqual(adapter._pool_connections, 10)
+        self.assertEqual(adapter._pool_maxsize, 10)
+
+        # Closing one console's session leaves the others' pools alone
+        adapter2 = console2.requests.get_adapter('https://localhost')
+        adapter2.poolmanager.connection_from_url('https://localhost')
+        console1.requests.close()
+        self.assertEqual(len(adapter2.poolmanager.pools), 1)
+
+    def testRetryMethods(self):
+        console1 = self._createConsole()
+        console2 = self._createConsole()
+        console1.configureRequestsRetry(total=2, allowed_methods=['GET'])
+        console2.configureRequestsRetry(total=2, method_whitelist=['GET'])
+        for console in (console1, console2):
+            adapter = console.requests.get_adapter('https://localhost')
+            self.assertEqual(list(adapter.max_retries.allowed_methods),
+                             ['GET'])
 
 
 class TestNPCConsole(unittest.TestCase):
@@ -224,6 +302,39 @@ class TestNPCConsole(unittest.TestCase):
             console.addHyp(hyp)
 
 
+class TestBackStoryConsole(unittest.TestCase):
+    def setUp(self):
+        self.rpcClient = mock.Mock()
+        self.tracker = mock.Mock()
+        type(self.tracker).name = \
+            mock.PropertyMock(return_value="BackStory Test")
+
+    def _createConsole(self):
+        return BackStoryConsole(id=0,
+                                directoryHandler=mock.Mock(),
+                                rpc_client=self.rpcClient,
+                                asyncData=mock.Mock(),
+                                config=dict(),
+                                tracker=self.tracker)
+
+    def testaddWithoutParents(self):
+        self.rpcClient.sendAndWait = mock.Mock(
+            return_value=RPCResponse(0, RPCResponseStatus.ok))
+        console = self._createConsole()
+
+        fact = Fact()
+        console.addFact(fact)
+        self.assertEqual(fact._creator_, "BackStory Test")
+        self.rpcClient.sendAndWait.assert_called_with(
+            args={'fact': fact},
+            command=RPCCommands.addFact)
+
+        hyp = Fact()
+        console.addHyp(hyp)
+        self.assertEqual(hyp._creator_, "BackStory Test")
+        self.assertTrue(hyp.tainted)
+
+
 class TestPlayerConsole(unittest.TestCase):
     def setUp(self):
         self.dhandler = mock.Mock()
@@ -348,6 +459,33 @@ class TestPlayerConsole(unittest.TestCase):
         self.rpcClient.stopStream.assert_called_with(0)
         self.assertEqual(['msg1'], msgs)
 
+        # The clone is looked up once per stream
+        self.tracker.clones = mock.MagicMock()
+        self.rpcClient.getStream = mock.Mock(return_value=['msg1', 'msg2'])
+        list(console._waitOn(0))
+        self.tracker.clones.__getitem__.assert_called_once_with(
+            console._cloneID)
+
+        clone = mock.Mock()
+        self.tracker.clones = {console._cloneID: clone}
+        blockedStates = list()
+
+        def getStream(stream_id):
+            blockedStates.append(clone._state)
+            yield 'msg1'
+            blockedStates.append(clone._state)
+
+        self.rpcClient.getStream = getStream
+        stream = console._waitOn(0)
+        self.assertEqual(next(stream), 'msg1')
+        self.assertEqual(clone._state, PlayerState.running)
+        with self.assertRaises(StopIteration):
+            next(stream)
+        self.assertEqual(blockedStates,
+                         [PlayerState.waiting, PlayerState.waiting])
+        self.assertEqual(clone._state, PlayerState.running)
+        self.rpcClient.stopStream.assert_called_with(0)
+
         self.rpcClient.getStream = mock.Mock(
             return_value=[Namespace(result=Namespace(fact=None))])
         msgs = list(console.waitOnFacts('md5'))
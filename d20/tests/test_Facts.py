@@ -108,6 +108,24 @@ class TestFacts(unittest.TestCase):
         bar = TestFact6.load(**data)
         self.assertEqual(foo.value, bar.value)
 
+        foo = TestFact6(value='bar', parentObjects=[1], _childHyps_=[2])
+        data = foo.save()
+        bar = TestFact6.load(**data)
+        self.assertEqual(bar.parentObjects, [1])
+        bar.addChildHyp(3)
+        self.assertEqual(foo.childHyps, [2])
+
+    def test6SaveCopiesEdgeSets(self):
+        @registerFact
+        class TestFact6_1(Fact):
+            _type_ = 'test6_1'
+            value = StringField()
+
+        foo = TestFact6_1(value='bar', parentObjects=[1])
+        data = foo.save()
+        data['_parentObjects_'].add(2)
+        self.assertEqual(foo.parentObjects, [1])
+
     def test7InvalidFieldName(self):
         with self.assertRaises(AttributeError):
             @registerFact
@@ -258,6 +276,21 @@ class TestFactUsage(unittest.TestCase):
         tf.remChildHyp(1)
         self.assertEqual(tf.childHyps, [2])
 
+        self.assertTrue(tf.hasParentObject(2))
+        self.assertFalse(tf.hasParentObject(1))
+        self.assertTrue(tf.hasParentFact(2))
+        self.assertTrue(tf.hasParentHyp(2))
+        self.assertTrue(tf.hasChildObject(2))
+        self.assertTrue(tf.hasChildFact(2))
+        self.assertFalse(tf.hasChildHyp(1))
+
+    def test3LazyRelationships(self):
+        tf = TestFactUsage1()
+        self.assertIsNone(tf._childFacts_)
+        self.assertEqual(tf.childFacts, [])
+        self.assertFalse(tf.hasChildFact(1))
+        self.assertEqual(tf.save()['_childFacts_'], set())
+
 
 class TestFields(unittest.TestCase):
     @classmethod
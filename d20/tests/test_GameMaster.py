@@ -1120,9 +1120,9 @@ def testCheckFactStreamerConditions(monkeypatch):
     gm = GameMaster(options=args)
 
     mockFact = mock.Mock()
-    mockFact.parentObjects = []
-    mockFact.parentFacts = []
-    mockFact.parentHyps = []
+    mockFact.hasParentObject.return_value = False
+    mockFact.hasParentFact.return_value = False
+    mockFact.hasParentHyp.return_value = False
     mockMsg = mock.Mock()
     mockStreamMsg = mock.Mock()
 
@@ -1183,9 +1183,9 @@ def testCheckHypStreamerConditions(monkeypatch):
     gm = GameMaster(options=args)
 
     mockHyp = mock.Mock()
-    mockHyp.parentObjects = []
-    mockHyp.parentFacts = []
-    mockHyp.parentHyps = []
+    mockHyp.hasParentObject.return_value = False
+    mockHyp.hasParentFact.return_value = False
+    mockHyp.hasParentHyp.return_value = False
     mockMsg = mock.Mock()
     mockStreamMsg = mock.Mock()
 
@@ -1246,9 +1246,9 @@ def testCheckObjectStreamerConditions(monkeypatch):
     gm = GameMaster(options=args)
 
     mockObj = mock.Mock()
-    mockObj.parentObjects = []
-    mockObj.parentFacts = []
-    mockObj.parentHyps = []
+    mockObj.hasParentObject.return_value = False
+    mockObj.hasParentFact.return_value = False
+    mockObj.hasParentHyp.return_value = False
     mockMsg = mock.Mock()
     mockStreamMsg = mock.Mock()
 
@@ -1618,13 +1618,20 @@ def testhandleAddObject(monkeypatch, caplog):
     gm.handleAddObject(mockMsg)
     mockOK.assert_called_with(mockMsg, result={'object_id': 0})
 
+    # Invalid arguments are reported for duplicates too
+    mockMsg.args.parentObjects = ['notint']
+    gm.handleAddObject(mockMsg)
+    mockErrorRsp.assert_called_with(mockMsg,
+                                    reason="Unable to track object: parent "
+                                           "objects must be a list of ints")
+
     mockMsg.args.parentObjects = []
     mockMsg.args.parentFacts = []
     mockMsg.args.parentHyps = []
     mockObj = mock.Mock()
     mockObj.id = 0
-    mockAddObj = mock.Mock(return_value=mockObj)
-    monkeypatch.setattr("d20.Manual.BattleMap.ObjectList.addObject",
+    mockAddObj = mock.Mock(return_value=(mockObj, True))
+    monkeypatch.setattr("d20.Manual.BattleMap.ObjectList.getOrAddObject",
                         mockAddObj)
     mockStreamMsg = mock.Mock()
     gm.objectStreamList = [mockStreamMsg]
@@ -1639,8 +1646,8 @@ def testhandleAddObject(monkeypatch, caplog):
     assert "Error calling NPC handleData function" in caplog.text
 
     gm.objectStreamList = []
-    mockAddObj = mock.Mock(return_value=None)
-    monkeypatch.setattr("d20.Manual.BattleMap.ObjectList.addObject",
+    mockAddObj = mock.Mock(return_value=(None, False))
+    monkeypatch.setattr("d20.Manual.BattleMap.ObjectList.getOrAddObject",
                         mockAddObj)
     gm.handleAddObject(mockMsg)
     mockErrorRsp.assert_called_with(mockMsg,
@@ -1,3 +1,4 @@
+import os
 import unittest
 from unittest import mock
 import pytest
@@ -14,7 +15,7 @@ from d20.Manual.Templates import (PlayerTemplate,
 from d20.Players import verifyPlayers
 from d20.NPCS import verifyNPCs
 from d20.Manual.Facts import loadFacts
-from d20.BackStories import verifyBackStories
+from d20.BackStories import verifyBackStories, resolveBackStoryFacts
 from d20.Manual.Registration import _test_version_string
 
 loadFacts()
@@ -182,6 +183,41 @@ class TestBackStoryRegistration(unittest.TestCase):
             "RegTestBackStory1",
             [backstory.registration.name for backstory in backstories],)
 
+    @mock.patch('d20.BackStories.LOGGER')
+    def test3duplicateBackStoryName(self, BackStoryLogger):
+        BackStoryLogger.warning = mock.Mock()
+
+        @registerBackStory(
+            name="RegTestBackStory3",
+            description="TestBackStory",
+            creator="",
+            version="0.1",
+            engine_version="0.1",
+            category="downloader")
+        class RegTestBackStory3(BackStoryTemplate):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+
+            def handleFact(self, **kwargs):
+                pass
+
+        @registerBackStory(
+            name="RegTestBackStory3",
+            description="TestBackStory",
+            creator="",
+            version="0.1",
+            engine_version="0.1",
+            category="downloader")
+        class RegTestBackStory4(BackStoryTemplate):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+
+            def handleFact(self, **kwargs):
+                pass
+
+        BackStoryLogger.warning.assert_called_with(
+            'BackStory with name %s already registered', 'RegTestBackStory3')
+
 
 def testRegistrationFormWrongOption():
     with pytest.raises(TypeError) as excinfo:
@@ -611,3 +647,65 @@ def testBackStoryRegistrationFormSave():
         if "BackStoryTester5" in backstory.name:
             save_dict = backstory.registration.save()
             assert test == save_dict
+
+
+def testBackStoryRegistrationNewerEngineVersion():
+    with pytest.raises(ValueError) as excinfo:
+        @registerBackStory(
+            name="BackStoryTester6",
+            description="Test BackStory",
+            creator="",
+            version="0.1",
+            engine_version="10.0",
+            category="test"
+        )
+        class RegTestBackStory(BackStoryTemplate):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+
+            def handleData(self, **kwargs):
+                pass
+
+    assert str(excinfo.value) == \
+        "BackStory BackStoryTester6 expects version 10.0 or newer"
+
+
+def testVersionStringUnhashable():
+    with pytest.raises(ValueError):
+        _test_version_string(["0.1"])
+
+
+def testResolveBackStoryFacts():
+    facts = resolveBackStoryFacts({'facts': [
+        {'name': 'MimeTypeFact',
+         'arguments': {'mimetype': 'text/plain', 'filetype': 'ASCII'}},
+        {'name': 'MimeTypeFact',
+         'arguments': {'mimetype': 'application/zip', 'filetype': 'Zip'}}
+    ]})
+    assert [fact.mimetype for fact in facts] == \
+        ['text/plain', 'application/zip']
+    assert resolveBackStoryFacts({}) == []
+
+
+def testLoadBackStoriesSkipsUnchangedPaths(tmp_path):
+    path = str(tmp_path)
+    with mock.patch('d20.BackStories.loadExtras') as mockLoad:
+        verifyBackStories([path], Configuration())
+        verifyBackStories([path], Configuration())
+        calls = [c for c in mockLoad.call_args_list if c[0][0] == [path]]
+        assert len(calls) == 1
+
+        (tmp_path / "newfile.py").write_text("")
+        # Don't rely on the filesystem's timestamp granularity
+        mtime = tmp_path.stat().st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime, mtime))
+        verifyBackStories([path], Configuration())
+        calls = [c for c in mockLoad.call_args_list if c[0][0] == [path]]
+        assert len(calls) == 2
+
+        # A file added within the same mtime tick is still picked up
+        (tmp_path / "otherfile.py").write_text("")
+        os.utime(path, ns=(mtime, mtime))
+        verifyBackStories([path], Configuration())
+        calls = [c for c in mockLoad.call_args_list if c[0][0] == [path]]
+        assert len(calls) == 3
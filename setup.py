@@ -37,6 +37,7 @@ setup(name="d20-framework",
           'ssdeep',
           'pyyaml>=5.1,<5.2',
           'requests',
+          'urllib3>=1.26',
           'packaging',
           'cerberus',
           'texttable'